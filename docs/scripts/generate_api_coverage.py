@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import os
+import re
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterable
 
 import yaml
 
@@ -20,30 +25,65 @@ STATUS_LABELS = {
     "not_applicable": "🚫",
 }
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_member_name = attrgetter("name")
+
+_ANCHOR_STRIP = re.compile(r"[.()]")
+_ANCHOR_WS = re.compile(r"\s+")
+
 
 def _format_date(date: datetime.date) -> str:
     month = date.strftime("%B")
     return f"{month} {date.day}, {date.year}"
 
 
-def _load_module(module_name: str):
+_LOADED_MODULES: dict[str, object] = {}
+
+
+def _module_exists(module_name: str) -> bool:
+    path = ROOT.joinpath(*module_name.split("."))
+    return path.with_suffix(".py").is_file() or (path / "__init__.py").is_file()
+
+
+def _prime(module_names: Iterable[str]) -> None:
+    missing: list[str] = []
+    for name in dict.fromkeys(module_names):
+        if name in _LOADED_MODULES:
+            continue
+        if _module_exists(name):
+            missing.append(name)
+        else:
+            _LOADED_MODULES[name] = None
+    if not missing:
+        return
     session = PydocMarkdown(
-        loaders=[PythonLoader(modules=[module_name], search_path=[str(ROOT)])]
+        loaders=[PythonLoader(modules=missing, search_path=[str(ROOT)])]
     )
     try:
         modules = session.load_modules()
     except Exception:
-        return None
-    return modules[0] if modules else None
+        if len(missing) == 1:
+            _LOADED_MODULES[missing[0]] = None
+        else:
+            for name in missing:
+                _prime([name])
+        return
+    for module in modules:
+        _LOADED_MODULES[module.name] = module
+    for name in missing:
+        _LOADED_MODULES.setdefault(name, None)
+
+
+def _load_module(module_name: str):
+    if module_name not in _LOADED_MODULES:
+        _prime([module_name])
+    return _LOADED_MODULES[module_name]
 
 
 def _iter_public_members(obj):
-    members = getattr(obj, "members", None) or []
-    for member in members:
-        name = getattr(member, "name", "")
-        if name.startswith("_"):
-            continue
-        yield member
+    members = getattr(obj, "members", None) or ()
+    return (member for member in members if not _member_name(member).startswith("_"))
 
 
 def _collect_module_items(module_name: str, prefix: str) -> set[str]:
@@ -52,7 +92,7 @@ def _collect_module_items(module_name: str, prefix: str) -> set[str]:
         return set()
     keys: set[str] = set()
     for member in _iter_public_members(module):
-        kind = member.__class__.__name__
+        kind = type(member).__name__
         if kind in {"Function"}:
             keys.add(f"{prefix}.{member.name}")
         elif kind == "Class":
@@ -66,13 +106,13 @@ def _collect_class_items(module_name: str, class_names: list[str]) -> set[str]:
         return set()
     keys: set[str] = set()
     for member in _iter_public_members(module):
-        if member.__class__.__name__ != "Class":
+        if type(member).__name__ != "Class":
             continue
         if member.name not in class_names:
             continue
         keys.add(member.name)
         for class_member in _iter_public_members(member):
-            kind = class_member.__class__.__name__
+            kind = type(class_member).__name__
             if kind == "Function":
                 if class_member.name == "__init__":
                     continue
@@ -82,23 +122,27 @@ def _collect_class_items(module_name: str, class_names: list[str]) -> set[str]:
     return keys
 
 
+_SCAN_TABLE: dict[str, dict[str, object] | None] = {
+    "Core Module (pygame)": {"kind": "module", "module": "ipygame", "prefix": "pygame"},
+    "pygame.Surface": {"kind": "class", "module": "ipygame.surface", "classes": ["Surface"]},
+    "pygame.Rect / FRect": {"kind": "class", "module": "ipygame.rect", "classes": ["Rect", "FRect"]},
+    "pygame.Color": {"kind": "class", "module": "ipygame.color", "classes": ["Color"]},
+    "pygame.Window": None,
+    "pygame.geometry": None,
+    "pygame.system": None,
+}
+
+
 def _infer_scan(title: str) -> dict[str, object] | None:
-    if title == "Core Module (pygame)":
-        return {"kind": "module", "module": "ipygame", "prefix": "pygame"}
+    if title in _SCAN_TABLE:
+        return _SCAN_TABLE[title]
     if title.startswith("pygame."):
-        name = title.split("pygame.", 1)[1]
-        if name in {"Surface", "Rect / FRect", "Color", "Window", "geometry", "system"}:
-            if name == "Surface":
-                return {"kind": "class", "module": "ipygame.surface", "classes": ["Surface"]}
-            if name == "Rect / FRect":
-                return {"kind": "class", "module": "ipygame.rect", "classes": ["Rect", "FRect"]}
-            if name == "Color":
-                return {"kind": "class", "module": "ipygame.color", "classes": ["Color"]}
-            return None
+        name = title[len("pygame."):]
         return {"kind": "module", "module": f"ipygame.{name}", "prefix": name}
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _default_label(key: str) -> str:
     if "." in key:
         left, right = key.split(".", 1)
@@ -115,7 +159,8 @@ def main() -> None:
         print(f"ERROR: {YAML_PATH} not found. Run bootstrap_api_coverage_yaml.py first.")
         raise SystemExit(1)
 
-    data = yaml.safe_load(YAML_PATH.read_text(encoding="utf-8")) or {}
+    with open(YAML_PATH, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
     meta = data.get("meta", {})
     sections = data.get("sections", [])
 
@@ -143,14 +188,8 @@ def main() -> None:
     ]
 
     def _anchor(title: str) -> str:
-        slug = title.lower()
-        slug = slug.replace("/", " ")
-        slug = slug.replace(".", "")
-        slug = slug.replace("(", "")
-        slug = slug.replace(")", "")
-        slug = slug.replace("  ", " ").strip()
-        slug = "-".join(slug.split())
-        return slug
+        slug = _ANCHOR_STRIP.sub("", title.lower()).replace("/", " ").strip()
+        return _ANCHOR_WS.sub("-", slug)
 
     for section in sections:
         title = section.get("title", "")
@@ -160,7 +199,16 @@ def main() -> None:
 
     lines.extend(["", "---", ""])
 
-    for section in sections:
+    append = lines.append
+    status_get = STATUS_LABELS.get
+
+    scans = [
+        section.get("scan") or _infer_scan(section.get("title", ""))
+        for section in sections
+    ]
+    _prime(scan.get("module") for scan in scans if scan)
+
+    for section, scan in zip(sections, scans):
         title = section.get("title", "")
         if title == "Table of Contents":
             continue
@@ -170,31 +218,24 @@ def main() -> None:
             item["key"]: item for item in items if "key" in item
         }
 
-        scan = section.get("scan") or _infer_scan(title)
+        scanned: set[str] = set()
         if scan:
             kind = scan.get("kind")
             if kind == "module":
                 module_name = scan.get("module")
                 prefix = scan.get("prefix") or module_name.split(".")[-1]
-                for key in sorted(_collect_module_items(module_name, prefix)):
-                    if key not in index:
-                        index[key] = {
-                            "key": key,
-                            "label": _default_label(key),
-                            "status": "not_implemented",
-                            "notes": "",
-                        }
+                scanned = _collect_module_items(module_name, prefix)
             elif kind == "class":
                 module_name = scan.get("module")
                 classes = scan.get("classes", [])
-                for key in sorted(_collect_class_items(module_name, classes)):
-                    if key not in index:
-                        index[key] = {
-                            "key": key,
-                            "label": _default_label(key),
-                            "status": "not_implemented",
-                            "notes": "",
-                        }
+                scanned = _collect_class_items(module_name, classes)
+        for key in sorted(scanned - index.keys()):
+            index[key] = {
+                "key": key,
+                "label": _default_label(key),
+                "status": "not_implemented",
+                "notes": "",
+            }
 
         lines.append(f"## {title}")
         lines.append("")
@@ -202,17 +243,23 @@ def main() -> None:
         lines.append("|----------|--------|-------|")
 
         for key, item in index.items():
-            label = item.get("label", _default_label(key))
+            label = item["label"] if "label" in item else _default_label(key)
             status = item.get("status", "not_implemented")
             if status == "partial":
                 status = "not_implemented"
-            status_icon = STATUS_LABELS.get(status, "❌")
+            status_icon = status_get(status, "❌")
             notes = item.get("notes", "")
-            lines.append(f"| `{label}` | {status_icon} | {notes} |")
+            append("| `" + str(label) + "` | " + status_icon + " | " + str(notes) + " |")
 
         lines.extend(["", "---", ""])
 
-    OUT_PATH.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    payload = memoryview(("\n".join(lines).rstrip() + "\n").encode("utf-8"))
+    fd = os.open(OUT_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
     print(f"Wrote {OUT_PATH.relative_to(ROOT)}")
 
 
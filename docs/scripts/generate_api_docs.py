@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from pydoc_markdown import PydocMarkdown
@@ -47,9 +49,32 @@ OUT_DIR = DOCS / "src" / "content" / "docs" / "api"
 
 STUB_MODULES = {"camera", "cursors", "freetype", "ftfont", "midi", "sndarray"}
 
-def generate_module_md(module_name: str) -> str:
-    session = PydocMarkdown(
-        loaders=[PythonLoader(modules=[f"ipygame.{module_name}"], search_path=[str(ROOT)])],
+_FRONTMATTER = (
+    "---\n"
+    "title: ipygame.%s\n"
+    "description: API reference for the ipygame.%s module.\n"
+    "sidebar:\n"
+    "  order: %d\n"
+    "---"
+)
+_STUB_FRONTMATTER = (
+    "---\n"
+    "title: ipygame.%s\n"
+    "description: API reference for the ipygame.%s module (stub).\n"
+    "sidebar:\n"
+    "  order: %d\n"
+    '  badge: "Stub"\n'
+    "---"
+)
+
+def _build_session(module_names: list[str]) -> PydocMarkdown:
+    return PydocMarkdown(
+        loaders=[
+            PythonLoader(
+                modules=[f"ipygame.{name}" for name in module_names],
+                search_path=[str(ROOT)],
+            )
+        ],
         processors=[
             FilterProcessor(
                 skip_empty_modules=False,
@@ -70,40 +95,45 @@ def generate_module_md(module_name: str) -> str:
             data_code_block=True,
         ),
     )
+
+
+def _generate_md(module_names: list[str]) -> dict[str, str]:
+    session = _build_session(module_names)
     modules = session.load_modules()
     session.process(modules)
-    return session.renderer.render_to_string(modules)
+    return {
+        module.name.split(".", 1)[1]: session.renderer.render_to_string([module])
+        for module in modules
+    }
+
+
+def generate_all_md() -> dict[str, str]:
+    names = [name for name, _, _ in API_MODULES]
+    workers = max(1, min(os.cpu_count() or 1, len(names)))
+    batches = [names[i::workers] for i in range(workers)]
+    if workers == 1:
+        return _generate_md(names)
+    bodies: dict[str, str] = {}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for result in ex.map(_generate_md, batches):
+            bodies.update(result)
+    return bodies
 
 
 def make_frontmatter(module_name: str, label: str, order: int) -> str:
-    is_stub = module_name in STUB_MODULES
-    description = (
-        f"API reference for the ipygame.{module_name} module (stub)."
-        if is_stub
-        else f"API reference for the ipygame.{module_name} module."
-    )
-    lines = [
-        "---",
-        f"title: ipygame.{module_name}",
-        f"description: {description}",
-        f"sidebar:",
-        f"  order: {order}",
-    ]
-    if is_stub:
-        lines.append(f'  badge: "Stub"')
-    lines.append("---")
-    return "\n".join(lines)
+    if module_name in STUB_MODULES:
+        return _STUB_FRONTMATTER % (module_name, module_name, order)
+    return _FRONTMATTER % (module_name, module_name, order)
 
 
 def postprocess(body: str, module_name: str) -> str:
-    lines = body.splitlines()
-    out: list[str] = []
-    for line in lines:
-        if line.startswith("# ipygame."):
-            continue
-        if line.strip() == f'<a id="ipygame.{module_name}"></a>':
-            continue
-        out.append(line)
+    anchor = f'<a id="ipygame.{module_name}"></a>'
+    out = [
+        line
+        for line in body.splitlines()
+        if not line.startswith("# ipygame.")
+        and not (line == anchor or ("<a" in line and line.strip() == anchor))
+    ]
 
     while out and not out[0].strip():
         out.pop(0)
@@ -113,9 +143,10 @@ def postprocess(body: str, module_name: str) -> str:
 
 def main() -> None:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
+    bodies = generate_all_md()
     for module_name, label, order in API_MODULES:
         print(f"Generating docs for ipygame.{module_name} ...")
-        body = generate_module_md(module_name)
+        body = bodies.get(module_name, "")
         if not body.strip():
             print(f"  SKIP (no output)")
             continue
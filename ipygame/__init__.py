@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import importlib as _importlib
+
 from ipygame.color import Color
 from ipygame.rect import Rect, FRect
 from ipygame.surface import Surface
@@ -11,6 +13,7 @@ from ipygame import (
     color,
     colordict,
     constants,
+    cursors,
     display,
     draw,
     event,
@@ -24,21 +27,21 @@ from ipygame import (
     mouse,
     pixelcopy,
     rect,
+    sprite,
     surface,
     surfarray,
     time,
     transform,
 )
 
-from ipygame import (
-    camera,
-    cursors,
-    freetype,
-    ftfont,
-    midi,
-    sndarray,
-    sprite,
-)
+# Stub modules are imported on first attribute access.
+_LAZY_SUBMODULES = frozenset({
+    "camera",
+    "freetype",
+    "ftfont",
+    "midi",
+    "sndarray",
+})
 
 __version__ = "0.1.0"
 
@@ -67,6 +70,18 @@ class error(RuntimeError):
     pass
 
 
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = _importlib.import_module(f"ipygame.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module 'ipygame' has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
+
 from ipygame._hook import (
     install as install_hook,
     uninstall as uninstall_hook,
@@ -15,6 +15,17 @@ __all__: list[str] = []
 class _Backend:
     """Singleton holding global display / init state."""
 
+    __slots__ = (
+        "canvas",
+        "display_surface",
+        "caption",
+        "icon",
+        "initialized",
+        "init_ticks",
+        "quit_flag",
+        "last_presented_pixels",
+    )
+
     def __init__(self):
         self.reset()
 
@@ -24,13 +35,13 @@ class _Backend:
         self.caption: str = "ipygame window"
         self.icon = None
         self.initialized: bool = False
-        self.init_ticks: float = 0.0
+        self.init_ticks: int = 0
         self.quit_flag: bool = False
         self.last_presented_pixels: np.ndarray | None = None
 
     def mark_init(self):
         self.initialized = True
-        self.init_ticks = time.perf_counter()
+        self.init_ticks = time.perf_counter_ns()
         self.quit_flag = False
 
     def mark_quit(self):
@@ -33,23 +33,28 @@ _SUBMODULE_MAP = {
     "pygame.transform":  "ipygame.transform",
 }
 
+_SUBMODULE_ITEMS = tuple(_SUBMODULE_MAP.items())
+
 
 def install() -> None:
     import ipygame
 
-    sys.modules.setdefault("pygame", ipygame)
+    modules = sys.modules
+    import_module = importlib.import_module
+    modules.setdefault("pygame", ipygame)
 
-    for pygame_name, ipygame_name in _SUBMODULE_MAP.items():
-        if pygame_name not in sys.modules:
-            try:
-                mod = importlib.import_module(ipygame_name)
-                sys.modules[pygame_name] = mod
-            except ImportError:
-                pass
+    for pygame_name, ipygame_name in _SUBMODULE_ITEMS:
+        if pygame_name in modules:
+            continue
+        try:
+            modules[pygame_name] = import_module(ipygame_name)
+        except ImportError:
+            pass
 
 
 def uninstall() -> None:
-    for key in list(sys.modules):
-        if key == "pygame" or key.startswith("pygame."):
-            if "ipygame" in getattr(sys.modules[key], "__name__", ""):
-                del sys.modules[key]
+    modules = sys.modules
+    for key in ("pygame", *_SUBMODULE_MAP):
+        mod = modules.get(key)
+        if mod is not None and "ipygame" in getattr(mod, "__name__", ""):
+            del modules[key]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+_MESSAGE = "ipygame.camera is not supported in Jupyter notebooks"
+
 
 def _not_implemented(*args, **kwargs):
-    raise NotImplementedError("ipygame.camera is not supported in Jupyter notebooks")
+    raise NotImplementedError(_MESSAGE)
 
 
 colorspace = _not_implemented
@@ -11,4 +13,4 @@ list_cameras = _not_implemented
 
 class Camera:
     def __init__(self, *args, **kwargs):
-        _not_implemented()
+        raise NotImplementedError(_MESSAGE)
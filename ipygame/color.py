@@ -1,18 +1,136 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Iterator, Self, Sequence, SupportsIndex
 
+import numpy as np
+
 from ipygame.colordict import THECOLORS
 
 __all__ = ["Color"]
 
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+
 
 def _clamp(v: int, lo: int = 0, hi: int = 255) -> int:
-    return max(lo, min(hi, int(v)))
+    if v.__class__ is not int:
+        v = int(v)
+    return lo if v < lo else hi if v > hi else v
+
+
+@lru_cache(maxsize=512)
+def _parse_color_string(s: str) -> tuple[int, int, int, int]:
+    s = s.strip()
+    if s.startswith("#"):
+        h = s[1:]
+        if len(h) == 6:
+            return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255)
+        if len(h) == 8:
+            return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), int(h[6:8], 16))
+        raise ValueError(f"invalid hex color: {s!r}")
+    if s.startswith("0x") or s.startswith("0X"):
+        v = int(s, 16)
+        return ((v >> 24) & 0xFF, (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+    rgba = THECOLORS.get(s) or THECOLORS.get(s.lower().replace(" ", ""))
+    if rgba is None:
+        raise ValueError(f"unknown color name: {s!r}")
+    return (rgba[0], rgba[1], rgba[2], rgba[3])
+
+
+@lru_cache(maxsize=16)
+def _gamma_lut(gamma: float) -> tuple[int, ...]:
+    inv = 1.0 / gamma
+    return tuple(_clamp(round(pow(i / 255.0, inv) * 255)) for i in range(256))
+
+
+_SWIZZLE_MAP = {"r": 0, "g": 1, "b": 2, "a": 3}
+
+
+@lru_cache(maxsize=256)
+def _swizzle_indices(name: str) -> tuple[int, ...] | None:
+    if 1 < len(name) <= 4 and all(c in _SWIZZLE_MAP for c in name):
+        return tuple(_SWIZZLE_MAP[c] for c in name)
+    return None
+
+
+def _hue(r: int, g: int, b: int, i: int, d: int) -> float:
+    """Hue in degrees; *i* is the index of the largest channel (0=r, 1=g, 2=b)."""
+    if d == 0:
+        return 0.0
+    if i == 0:
+        return 60.0 * (((g - b) / d) % 6)
+    if i == 1:
+        return 60.0 * ((b - r) / d + 2)
+    return 60.0 * ((r - g) / d + 4)
+
+
+def _max_channel(r: int, g: int, b: int) -> tuple[int, int, int]:
+    """Return (max, min, index of max) with ties going to r, then g."""
+    if r >= g:
+        if r >= b:
+            return r, (g if g < b else b), 0
+        return b, g, 2
+    if g >= b:
+        return g, (r if r < b else b), 1
+    return b, r, 2
+
+
+def _rgb_to_hsv(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """Convert 0-255 channels to (hue 0-360, sat 0-100, value 0-100)."""
+    mx, mn, i = _max_channel(r, g, b)
+    d = mx - mn
+    s = 0.0 if mx == 0 else d / mx * 100.0
+    return (_hue(r, g, b, i, d), s, mx / 255.0 * 100.0)
+
+
+def _rgb_to_hsl(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """Convert 0-255 channels to (hue 0-360, sat 0-100, lightness 0-100)."""
+    mx, mn, i = _max_channel(r, g, b)
+    d = mx - mn
+    l = (mx + mn) / 510.0 * 100.0
+    if d == 0:
+        return (0.0, 0.0, l)
+    return (_hue(r, g, b, i, d), d / (255 - abs(mx + mn - 255)) * 100.0, l)
+
+
+def _chroma_to_rgb(h: float, c: float, m: float) -> tuple[int, int, int]:
+    x = c * (1 - abs((h / 60.0) % 2 - 1))
+    if h < 60:
+        r1, g1, b1 = c, x, 0.0
+    elif h < 120:
+        r1, g1, b1 = x, c, 0.0
+    elif h < 180:
+        r1, g1, b1 = 0.0, c, x
+    elif h < 240:
+        r1, g1, b1 = 0.0, x, c
+    elif h < 300:
+        r1, g1, b1 = x, 0.0, c
+    else:
+        r1, g1, b1 = c, 0.0, x
+    return (_clamp(round((r1 + m) * 255)),
+            _clamp(round((g1 + m) * 255)),
+            _clamp(round((b1 + m) * 255)))
+
+
+def _hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
+    s /= 100.0
+    v /= 100.0
+    c = v * s
+    return _chroma_to_rgb(h, c, v - c)
+
+
+def _hsl_to_rgb(h: float, s: float, l: float) -> tuple[int, int, int]:
+    s /= 100.0
+    l /= 100.0
+    c = (1 - abs(2 * l - 1)) * s
+    return _chroma_to_rgb(h, c, l - c / 2.0)
 
 
 class Color:
+    # Channels stay as four separate ints: CPython caches 0-255, so each slot
+    # is just a shared pointer.  A packed RGBA int above 2**30 would need its
+    # own allocation and a shift/mask on every channel read.
     __slots__ = ("_r", "_g", "_b", "_a")
 
     def __init__(self, *args):
@@ -38,34 +156,18 @@ class Color:
                 f"Color() takes 1, 3, or 4 arguments ({len(args)} given)"
             )
 
+    @classmethod
+    def _new(cls, r: int, g: int, b: int, a: int) -> Self:
+        """Build a Color from channels that are already ints in 0-255."""
+        obj = cls.__new__(cls)
+        obj._r = r
+        obj._g = g
+        obj._b = b
+        obj._a = a
+        return obj
+
     def _from_string(self, s: str) -> None:
-        s = s.strip()
-        if s.startswith("#"):
-            h = s[1:]
-            if len(h) == 6:
-                self._r = int(h[0:2], 16)
-                self._g = int(h[2:4], 16)
-                self._b = int(h[4:6], 16)
-                self._a = 255
-            elif len(h) == 8:
-                self._r = int(h[0:2], 16)
-                self._g = int(h[2:4], 16)
-                self._b = int(h[4:6], 16)
-                self._a = int(h[6:8], 16)
-            else:
-                raise ValueError(f"invalid hex color: {s!r}")
-        elif s.startswith("0x") or s.startswith("0X"):
-            v = int(s, 16)
-            self._r = (v >> 24) & 0xFF
-            self._g = (v >> 16) & 0xFF
-            self._b = (v >> 8) & 0xFF
-            self._a = v & 0xFF
-        else:
-            key = s.lower().replace(" ", "")
-            if key not in THECOLORS:
-                raise ValueError(f"unknown color name: {s!r}")
-            rgba = THECOLORS[key]
-            self._r, self._g, self._b, self._a = rgba[0], rgba[1], rgba[2], rgba[3]
+        self._r, self._g, self._b, self._a = _parse_color_string(s)
 
     def _from_sequence(self, seq: Sequence) -> None:
         if len(seq) == 3:
@@ -171,31 +273,14 @@ class Color:
     @property
     def hsva(self) -> tuple[float, float, float, float]:
         """(hue 0-360, sat 0-100, value 0-100, alpha 0-100)."""
-        r, g, b = self._r / 255.0, self._g / 255.0, self._b / 255.0
-        mx, mn = max(r, g, b), min(r, g, b)
-        d = mx - mn
-        # Value
-        v = mx * 100.0
-        # Saturation
-        s = 0.0 if mx == 0 else (d / mx) * 100.0
-        # Hue
-        if d == 0:
-            h = 0.0
-        elif mx == r:
-            h = 60.0 * (((g - b) / d) % 6)
-        elif mx == g:
-            h = 60.0 * (((b - r) / d) + 2)
-        else:
-            h = 60.0 * (((r - g) / d) + 4)
-        if h < 0:
-            h += 360.0
+        h, s, v = _rgb_to_hsv(self._r, self._g, self._b)
         return (h, s, v, self._a / 255.0 * 100.0)
 
     @hsva.setter
     def hsva(self, value: tuple[float, float, float, float]) -> None:
         h, s, v, a = value
-        c = self._from_hsva_vals(h, s, v, a)
-        self._r, self._g, self._b, self._a = c._r, c._g, c._b, c._a
+        self._r, self._g, self._b = _hsv_to_rgb(h, s, v)
+        self._a = _clamp(round(a / 100.0 * 255))
 
     @classmethod
     def from_hsva(cls, h: float, s: float, v: float, a: float = 100.0) -> Self:
@@ -203,80 +288,71 @@ class Color:
 
     @classmethod
     def _from_hsva_vals(cls, h: float, s: float, v: float, a: float) -> Self:
-        s /= 100.0
-        v /= 100.0
-        c = v * s
-        x = c * (1 - abs((h / 60.0) % 2 - 1))
-        m = v - c
-        if h < 60:
-            r1, g1, b1 = c, x, 0.0
-        elif h < 120:
-            r1, g1, b1 = x, c, 0.0
-        elif h < 180:
-            r1, g1, b1 = 0.0, c, x
-        elif h < 240:
-            r1, g1, b1 = 0.0, x, c
-        elif h < 300:
-            r1, g1, b1 = x, 0.0, c
-        else:
-            r1, g1, b1 = c, 0.0, x
         obj = cls.__new__(cls)
-        obj._r = _clamp(round((r1 + m) * 255))
-        obj._g = _clamp(round((g1 + m) * 255))
-        obj._b = _clamp(round((b1 + m) * 255))
+        obj._r, obj._g, obj._b = _hsv_to_rgb(h, s, v)
         obj._a = _clamp(round(a / 100.0 * 255))
         return obj
 
+    @staticmethod
+    def from_hsva_batch(hsva) -> np.ndarray:
+        """Convert an ``(..., 4)`` array of ``hsva`` values to ``uint8`` RGBA."""
+        arr = np.asarray(hsva, dtype=np.float64)
+        h, s, v, a = np.moveaxis(arr, -1, 0)
+        s = s / 100.0
+        v = v / 100.0
+        c = v * s
+        x = c * (1 - np.abs((h / 60.0) % 2 - 1))
+        m = v - c
+        zero = np.zeros_like(c)
+        sectors = [h < 60, h < 120, h < 180, h < 240, h < 300]
+        r1 = np.select(sectors, [c, x, zero, zero, x], c)
+        g1 = np.select(sectors, [x, c, c, x, zero], zero)
+        b1 = np.select(sectors, [zero, zero, x, c, c], x)
+        out = np.stack(
+            [(r1 + m) * 255, (g1 + m) * 255, (b1 + m) * 255, a / 100.0 * 255],
+            axis=-1,
+        )
+        return np.clip(np.rint(out), 0, 255).astype(np.uint8)
+
+    @staticmethod
+    def to_hsva_batch(rgba) -> np.ndarray:
+        """Convert an ``(..., 3)`` or ``(..., 4)`` RGB(A) array to ``hsva`` values."""
+        arr = np.asarray(rgba)
+        rgb = arr[..., :3].astype(np.int64)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        mx = rgb.max(axis=-1)
+        d = mx - rgb.min(axis=-1)
+        dd = np.where(d == 0, 1, d)
+        h = np.where(
+            mx == r,
+            60.0 * (((g - b) / dd) % 6),
+            np.where(mx == g, 60.0 * ((b - r) / dd + 2), 60.0 * ((r - g) / dd + 4)),
+        )
+        h = np.where(d == 0, 0.0, h)
+        s = np.where(mx == 0, 0.0, d / np.where(mx == 0, 1, mx) * 100.0)
+        v = mx / 255.0 * 100.0
+        if arr.shape[-1] == 4:
+            a = arr[..., 3] / 255.0 * 100.0
+        else:
+            a = np.full(v.shape, 100.0)
+        return np.stack([h, s, v, a], axis=-1)
+
     @property
     def hsla(self) -> tuple[float, float, float, float]:
         """(hue 0-360, sat 0-100, lightness 0-100, alpha 0-100)."""
-        r, g, b = self._r / 255.0, self._g / 255.0, self._b / 255.0
-        mx, mn = max(r, g, b), min(r, g, b)
-        d = mx - mn
-        l = (mx + mn) / 2.0
-        if d == 0:
-            h = s = 0.0
-        else:
-            s = d / (1 - abs(2 * l - 1)) if (1 - abs(2 * l - 1)) != 0 else 0.0
-            if mx == r:
-                h = 60.0 * (((g - b) / d) % 6)
-            elif mx == g:
-                h = 60.0 * (((b - r) / d) + 2)
-            else:
-                h = 60.0 * (((r - g) / d) + 4)
-        if h < 0:
-            h += 360.0
-        return (h, s * 100.0, l * 100.0, self._a / 255.0 * 100.0)
+        h, s, l = _rgb_to_hsl(self._r, self._g, self._b)
+        return (h, s, l, self._a / 255.0 * 100.0)
 
     @hsla.setter
     def hsla(self, value: tuple[float, float, float, float]) -> None:
         h, s, l, a = value
-        c = self.from_hsla(h, s, l, a)
-        self._r, self._g, self._b, self._a = c._r, c._g, c._b, c._a
+        self._r, self._g, self._b = _hsl_to_rgb(h, s, l)
+        self._a = _clamp(round(a / 100.0 * 255))
 
     @classmethod
     def from_hsla(cls, h: float, s: float, l: float, a: float = 100.0) -> Self:
-        s /= 100.0
-        l /= 100.0
-        c = (1 - abs(2 * l - 1)) * s
-        x = c * (1 - abs((h / 60.0) % 2 - 1))
-        m = l - c / 2.0
-        if h < 60:
-            r1, g1, b1 = c, x, 0.0
-        elif h < 120:
-            r1, g1, b1 = x, c, 0.0
-        elif h < 180:
-            r1, g1, b1 = 0.0, c, x
-        elif h < 240:
-            r1, g1, b1 = 0.0, x, c
-        elif h < 300:
-            r1, g1, b1 = x, 0.0, c
-        else:
-            r1, g1, b1 = c, 0.0, x
         obj = cls.__new__(cls)
-        obj._r = _clamp(round((r1 + m) * 255))
-        obj._g = _clamp(round((g1 + m) * 255))
-        obj._b = _clamp(round((b1 + m) * 255))
+        obj._r, obj._g, obj._b = _hsl_to_rgb(h, s, l)
         obj._a = _clamp(round(a / 100.0 * 255))
         return obj
 
@@ -322,7 +398,7 @@ class Color:
 
     @property
     def hex(self) -> str:
-        return f"#{self._r:02X}{self._g:02X}{self._b:02X}{self._a:02X}"
+        return "#" + _HEX2[self._r] + _HEX2[self._g] + _HEX2[self._b] + _HEX2[self._a]
 
     @classmethod
     def from_hex(cls, h: str) -> Self:
@@ -332,8 +408,11 @@ class Color:
         return self.normalized
 
     def correct_gamma(self, gamma: float) -> Color:
+        if gamma > 0:
+            lut = _gamma_lut(gamma)
+            return Color._new(lut[self._r], lut[self._g], lut[self._b], self._a)
         inv = 1.0 / gamma
-        return Color(
+        return Color._new(
             _clamp(round(pow(self._r / 255.0, inv) * 255)),
             _clamp(round(pow(self._g / 255.0, inv) * 255)),
             _clamp(round(pow(self._b / 255.0, inv) * 255)),
@@ -343,7 +422,7 @@ class Color:
     def lerp(self, other: Color | tuple, t: float) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
+        return Color._new(
             _clamp(round(self._r + (other._r - self._r) * t)),
             _clamp(round(self._g + (other._g - self._g) * t)),
             _clamp(round(self._b + (other._b - self._b) * t)),
@@ -351,15 +430,15 @@ class Color:
         )
 
     def grayscale(self) -> Color:
-        grey = _clamp(round(0.299 * self._r + 0.587 * self._g + 0.114 * self._b))
-        return Color(grey, grey, grey, self._a)
+        grey = round(0.299 * self._r + 0.587 * self._g + 0.114 * self._b)
+        return Color._new(grey, grey, grey, self._a)
 
     def premul_alpha(self) -> Color:
         af = self._a / 255.0
-        return Color(
-            _clamp(round(self._r * af)),
-            _clamp(round(self._g * af)),
-            _clamp(round(self._b * af)),
+        return Color._new(
+            round(self._r * af),
+            round(self._g * af),
+            round(self._b * af),
             self._a,
         )
 
@@ -367,40 +446,51 @@ class Color:
         tmp = Color(*args)
         self._r, self._g, self._b, self._a = tmp._r, tmp._g, tmp._b, tmp._a
 
+    # Saturate with conditional expressions; a min()/max() call per channel
+    # costs more than the arithmetic itself.
+
     def __add__(self, other: Color | tuple) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
-            min(self._r + other._r, 255),
-            min(self._g + other._g, 255),
-            min(self._b + other._b, 255),
-            min(self._a + other._a, 255),
+        r = self._r + other._r
+        g = self._g + other._g
+        b = self._b + other._b
+        a = self._a + other._a
+        return Color._new(
+            r if r < 255 else 255,
+            g if g < 255 else 255,
+            b if b < 255 else 255,
+            a if a < 255 else 255,
         )
 
     def __sub__(self, other: Color | tuple) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
-            max(self._r - other._r, 0),
-            max(self._g - other._g, 0),
-            max(self._b - other._b, 0),
-            max(self._a - other._a, 0),
+        r = self._r - other._r
+        g = self._g - other._g
+        b = self._b - other._b
+        a = self._a - other._a
+        return Color._new(
+            r if r > 0 else 0,
+            g if g > 0 else 0,
+            b if b > 0 else 0,
+            a if a > 0 else 0,
         )
 
     def __mul__(self, other: Color | tuple) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
-            _clamp((self._r * other._r) // 256),
-            _clamp((self._g * other._g) // 256),
-            _clamp((self._b * other._b) // 256),
-            _clamp((self._a * other._a) // 256),
+        return Color._new(
+            (self._r * other._r) // 256,
+            (self._g * other._g) // 256,
+            (self._b * other._b) // 256,
+            (self._a * other._a) // 256,
         )
 
     def __floordiv__(self, other: Color | tuple) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
+        return Color._new(
             self._r // other._r if other._r else 0,
             self._g // other._g if other._g else 0,
             self._b // other._b if other._b else 0,
@@ -410,7 +500,7 @@ class Color:
     def __mod__(self, other: Color | tuple) -> Color:
         if not isinstance(other, Color):
             other = Color(other)
-        return Color(
+        return Color._new(
             self._r % other._r if other._r else 0,
             self._g % other._g if other._g else 0,
             self._b % other._b if other._b else 0,
@@ -418,7 +508,7 @@ class Color:
         )
 
     def __invert__(self) -> Color:
-        return Color(255 - self._r, 255 - self._g, 255 - self._b, 255 - self._a)
+        return Color._new(255 - self._r, 255 - self._g, 255 - self._b, 255 - self._a)
 
     # Comparison and hashing
 
@@ -427,11 +517,12 @@ class Color:
             return (self._r == other._r and self._g == other._g
                     and self._b == other._b and self._a == other._a)
         if isinstance(other, (tuple, list)) and len(other) in (3, 4):
-            return tuple(self) == (tuple(other) if len(other) == 4
-                                   else (*other, 255))
+            return (self._r, self._g, self._b, self._a) == (
+                tuple(other) if len(other) == 4 else (*other, 255))
         return NotImplemented
 
     def __hash__(self) -> int:
+        # Must match hash() of the equal RGBA tuple so tuple keys find Colors.
         return hash((self._r, self._g, self._b, self._a))
 
     def __bool__(self) -> bool:
@@ -443,14 +534,12 @@ class Color:
     def __repr__(self) -> str:
         return f"Color({self._r}, {self._g}, {self._b}, {self._a})"
 
-
-    _SWIZZLE_MAP = {"r": 0, "g": 1, "b": 2, "a": 3}
-
     def __getattr__(self, name: str):
-        if 1 < len(name) <= 4 and all(c in self._SWIZZLE_MAP for c in name):
-            vals = tuple(self[self._SWIZZLE_MAP[c]] for c in name)
-            return vals
-        raise AttributeError(f"'Color' object has no attribute {name!r}")
+        idx = _swizzle_indices(name)
+        if idx is None:
+            raise AttributeError(f"'Color' object has no attribute {name!r}")
+        t = (self._r, self._g, self._b, self._a)
+        return tuple([t[i] for i in idx])
 
     # Helper methods
 
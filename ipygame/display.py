@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import io
 import os
+import time
 import warnings
-from typing import Sequence
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, Sequence
 
 import numpy as np
 
@@ -19,6 +22,7 @@ __all__ = [
     "set_icon", "iconify", "toggle_fullscreen",
     "Info", "get_driver",
     "get_window_size",
+    "batch", "get_stats",
 ]
 
 
@@ -53,7 +57,7 @@ def set_mode(
 
     The canvas widget is automatically shown in the notebook output.
     """
-    from ipycanvas import Canvas, hold_canvas
+    from ipycanvas import Canvas
     from IPython.display import display as ipy_display
 
     b = get_backend()
@@ -108,6 +112,94 @@ def _env_float(name: str, default: float) -> float:
 
 _DELTA_FLIP_ENABLED = _env_bool("IPYGAME_DELTA_FLIP", True)
 _DELTA_FLIP_MAX_BBOX_RATIO = max(0.05, min(1.0, _env_float("IPYGAME_DELTA_FLIP_MAX_BBOX_RATIO", 0.70)))
+_PNG_COMPRESS_LEVEL = int(max(0, min(9, _env_float("IPYGAME_PNG_COMPRESS_LEVEL", 1))))
+_STATS_ENABLED = _env_bool("IPYGAME_DISPLAY_STATS", False)
+
+_stats = {
+    "flushes": 0,
+    "uploads": 0,
+    "pixels_sent": 0,
+    "bytes_sent": 0,
+    "flush_time": 0.0,
+}
+
+
+def get_stats(reset: bool = False) -> dict:
+    """Return canvas upload counters (ipygame extension, not in pygame).
+
+    Counting is off unless ``IPYGAME_DISPLAY_STATS=1`` is set before import.
+    ``flushes`` counts ``flip()``/``update()`` calls that reached the canvas,
+    ``uploads`` the images sent, ``pixels_sent`` their total pixel count,
+    ``bytes_sent`` their encoded size (only for uploads ipygame encodes
+    itself, not those left to ``canvas.put_image_data``) and
+    ``flush_time`` the seconds spent in those calls.  In a notebook these
+    uploads, not drawing, are usually the cost of a frame.
+    """
+    out = dict(_stats)
+    if reset:
+        for k in _stats:
+            _stats[k] = 0.0 if k == "flush_time" else 0
+    return out
+
+
+def _record_flush(start: float) -> None:
+    _stats["flushes"] += 1
+    _stats["flush_time"] += time.perf_counter() - start
+
+
+# Bound once by _bind_canvas_helpers() rather than imported per flip; not
+# imported at module level so ``import ipygame`` doesn't pull in ipywidgets.
+_hold_canvas = None
+# ipycanvas' private putImageData command id, or None to go through the
+# public ``put_image_data`` instead.
+_PUT_IMAGE_DATA_COMMAND = None
+_Image = None
+
+
+def _bind_canvas_helpers() -> None:
+    global _hold_canvas, _PUT_IMAGE_DATA_COMMAND, _Image
+    from ipycanvas import hold_canvas as _hold_canvas
+    try:
+        from ipycanvas.canvas import COMMANDS
+        from PIL import Image as _Image
+        _PUT_IMAGE_DATA_COMMAND = COMMANDS["putImageData"]
+    except (ImportError, AttributeError, KeyError):
+        _PUT_IMAGE_DATA_COMMAND = None
+
+
+_batch_depth = 0
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Hold canvas uploads inside the block and send them together on exit.
+
+    Wrapping a frame's ``update()``/``flip()`` calls in ``with batch():``
+    turns them into a single widget message. ipygame extension, not in
+    pygame.
+    """
+    global _batch_depth
+    canvas = get_backend().canvas
+    if canvas is None or _batch_depth:
+        _batch_depth += 1
+        try:
+            yield
+        finally:
+            _batch_depth -= 1
+        return
+    if _hold_canvas is None:
+        _bind_canvas_helpers()
+    _batch_depth += 1
+    try:
+        with _hold_canvas(canvas):
+            yield
+    finally:
+        _batch_depth -= 1
+
+
+def _hold(canvas):
+    """``hold_canvas`` for one flush, unless a ``batch()`` already holds it."""
+    return nullcontext() if _batch_depth else _hold_canvas(canvas)
 
 
 def flip() -> None:
@@ -115,7 +207,11 @@ def flip() -> None:
     b = get_backend()
     if b.canvas is None or b.display_surface is None:
         return
+    if _STATS_ENABLED:
+        start = time.perf_counter()
     _flush_surface_to_canvas(b.canvas, b.display_surface, use_delta=_DELTA_FLIP_ENABLED)
+    if _STATS_ENABLED:
+        _record_flush(start)
 
 
 def update(rectangle=None) -> None:
@@ -132,39 +228,42 @@ def update(rectangle=None) -> None:
     if not rects:
         return
 
-    _flush_rects_to_canvas(b.canvas, b.display_surface, rects)
+    if _STATS_ENABLED:
+        start = time.perf_counter()
+    rects = _flush_rects_to_canvas(b.canvas, b.display_surface, rects)
     _update_presented_cache_for_rects(b.display_surface, rects)
+    if _STATS_ENABLED:
+        _record_flush(start)
 
 
 def _flush_surface_to_canvas(canvas, surface: Surface, *, use_delta: bool) -> None:
     """Transfer Surface pixels to the ipycanvas Canvas, optionally using a delta update."""
-    from ipycanvas import hold_canvas
-
+    if _hold_canvas is None:
+        _bind_canvas_helpers()
     b = get_backend()
     current = surface._pixels
 
-    if not use_delta:
-        with hold_canvas(canvas):
-            canvas.put_image_data(current, 0, 0)
-        b.last_presented_pixels = current.copy()
-        return
-
     previous = b.last_presented_pixels
-    if previous is None or previous.shape != current.shape:
-        with hold_canvas(canvas):
-            canvas.put_image_data(current, 0, 0)
-        b.last_presented_pixels = current.copy()
+    if not use_delta or previous is None or previous.shape != current.shape:
+        with _hold(canvas):
+            _put_image_data(canvas, current, 0, 0)
+        _remember_presented(b, current)
         return
 
-    changed = np.any(current != previous, axis=2)
-    if not np.any(changed):
+    # No separate fingerprint pass: hashing a frame (even crc32) costs more
+    # than a straight compare, and memcmp stops at the first difference.
+    if _same_bytes(current, previous):
+        return
+    changed = _changed_pixels(current, previous)
+    rows = changed.any(axis=1)
+    if not rows.any():
         return
+    cols = changed.any(axis=0)
 
-    ys, xs = np.where(changed)
-    min_y = int(ys.min())
-    max_y = int(ys.max())
-    min_x = int(xs.min())
-    max_x = int(xs.max())
+    min_y = int(rows.argmax())
+    max_y = int(rows.shape[0] - 1 - rows[::-1].argmax())
+    min_x = int(cols.argmax())
+    max_x = int(cols.shape[0] - 1 - cols[::-1].argmax())
 
     patch_w = max_x - min_x + 1
     patch_h = max_y - min_y + 1
@@ -173,17 +272,84 @@ def _flush_surface_to_canvas(canvas, surface: Surface, *, use_delta: bool) -> No
     patch_ratio = patch_area / max(1, full_area)
 
     if patch_ratio > _DELTA_FLIP_MAX_BBOX_RATIO:
-        with hold_canvas(canvas):
-            canvas.put_image_data(current, 0, 0)
-        previous[:, :] = current
+        with _hold(canvas):
+            _put_image_data(canvas, current, 0, 0)
+        np.copyto(previous, current)
         return
 
     patch = current[min_y:max_y + 1, min_x:max_x + 1]
-    with hold_canvas(canvas):
-        canvas.put_image_data(patch, min_x, min_y)
+    with _hold(canvas):
+        _put_image_data(canvas, patch, min_x, min_y)
     previous[min_y:max_y + 1, min_x:max_x + 1] = patch
 
 
+def _put_image_data(canvas, pixels: np.ndarray, x: int, y: int) -> None:
+    """Send *pixels* to the canvas like ``put_image_data``, with a faster PNG encode.
+
+    ipycanvas encodes every upload as PNG at zlib level 6 (after an
+    ``astype`` copy); frames are re-sent constantly, so a low level is a
+    better trade of encode time against message size.  That relies on
+    ipycanvas internals, so when they are missing this falls back to the
+    public ``put_image_data``.
+    """
+    if _STATS_ENABLED:
+        _stats["uploads"] += 1
+        _stats["pixels_sent"] += pixels.shape[0] * pixels.shape[1]
+    send = None
+    if _PUT_IMAGE_DATA_COMMAND is not None:
+        send = getattr(getattr(canvas, "_canvas_manager", None),
+                       "send_draw_command", None)
+    if send is None:
+        # ipycanvas encodes this one itself, so bytes_sent can't count it.
+        canvas.put_image_data(pixels, x, y)
+        return
+    buf = io.BytesIO()
+    _Image.fromarray(pixels, "RGBA").save(buf, "PNG", compress_level=_PNG_COMPRESS_LEVEL)
+    data = buf.getvalue()
+    if _STATS_ENABLED:
+        _stats["bytes_sent"] += len(data)
+    send(canvas, _PUT_IMAGE_DATA_COMMAND, [x, y], [data])
+
+
+def _remember_presented(b, current: np.ndarray) -> None:
+    """Store *current* as the last presented frame, reusing the old buffer if possible."""
+    previous = b.last_presented_pixels
+    if previous is not None and previous.shape == current.shape:
+        np.copyto(previous, current)
+    else:
+        b.last_presented_pixels = current.copy()
+
+
+def _load_memcmp():
+    try:
+        import ctypes
+        memcmp = ctypes.CDLL(None).memcmp
+    except (ImportError, OSError, TypeError, AttributeError):
+        return None
+    memcmp.restype = ctypes.c_int
+    memcmp.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)
+    return memcmp
+
+
+_memcmp = _load_memcmp()
+
+
+def _same_bytes(current: np.ndarray, previous: np.ndarray) -> bool:
+    """Cheap exact-equality check; ``False`` just means "run the full diff"."""
+    if (_memcmp is None or not current.flags.c_contiguous
+            or not previous.flags.c_contiguous):
+        return False
+    return _memcmp(current.ctypes.data, previous.ctypes.data, current.nbytes) == 0
+
+
+def _changed_pixels(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """Return an (H, W) bool mask of pixels that differ between two RGBA buffers."""
+    if current.flags.c_contiguous and previous.flags.c_contiguous:
+        # One uint32 compare per pixel instead of four uint8 compares + a reduction.
+        return current.view(np.uint32)[..., 0] != previous.view(np.uint32)[..., 0]
+    return np.any(current != previous, axis=2)
+
+
 def _coerce_rectangles(rectangle, surface: Surface) -> list[Rect]:
     def _to_rect(value) -> Rect | None:
         if isinstance(value, Rect):
@@ -218,13 +384,44 @@ def _coerce_rectangles(rectangle, surface: Surface) -> list[Rect]:
     return [r] if r is not None else []
 
 
-def _flush_rects_to_canvas(canvas, surface: Surface, rects: list[Rect]) -> None:
-    from ipycanvas import hold_canvas
+_RECT_COALESCE_RATIO = 1.5
+
 
-    with hold_canvas(canvas):
+def _flush_rects_to_canvas(canvas, surface: Surface, rects: list[Rect]) -> list[Rect]:
+    if _hold_canvas is None:
+        _bind_canvas_helpers()
+    if len(rects) > 1:
+        rects = _merge_rects(rects)
+
+    with _hold(canvas):
         for r in rects:
             patch = surface._pixels[r.y:r.y + r.h, r.x:r.x + r.w]
-            canvas.put_image_data(patch, r.x, r.y)
+            _put_image_data(canvas, patch, r.x, r.y)
+    return rects
+
+
+def _merge_rects(rects: list[Rect]) -> list[Rect]:
+    """Greedily merge rects whose union costs little more than the pair.
+
+    Each upload is a separate widget message, so a few extra pixels are
+    cheaper than another round of PNG encode + comm overhead.
+    """
+    merged: list[Rect] = []
+    pending = rects[::-1]
+    while pending:
+        r = pending.pop()
+        for i, m in enumerate(merged):
+            u = m.union(r)
+            # Overlapping rects always merge so no pixel is uploaded twice.
+            if (m.colliderect(r) or
+                    u.w * u.h <= _RECT_COALESCE_RATIO * (m.w * m.h + r.w * r.h)):
+                # The union may now reach other merged rects; recheck it.
+                del merged[i]
+                pending.append(u)
+                break
+        else:
+            merged.append(r)
+    return merged
 
 
 def _update_presented_cache_for_rects(surface: Surface, rects: list[Rect]) -> None:
@@ -8,7 +8,7 @@ from typing import Sequence
 import numpy as np
 
 from ipygame.rect import Rect
-from ipygame.surface import Surface, _color_to_rgba
+from ipygame.surface import Surface, _color_to_rgba, _fill_pixels, _native_pixel
 
 __all__ = [
     "rect", "circle", "ellipse", "arc",
@@ -30,6 +30,12 @@ def _set_pixel(pixels: np.ndarray, x: int, y: int, rgba, h: int, w: int):
         pixels[y, x] = rgba
 
 
+def _set_pixels(pixels: np.ndarray, xs: np.ndarray, ys: np.ndarray, rgba, h: int, w: int):
+    """Vector form of ``_set_pixel``: set every in-bounds (xs[i], ys[i])."""
+    inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    pixels[ys[inside], xs[inside]] = rgba
+
+
 def rect(
     surface: Surface,
     color,
@@ -50,21 +56,21 @@ def rect(
 
     px = surface._pixels
     if width == 0:
-        px[area.y:area.y + area.h, area.x:area.x + area.w] = rgba
+        _fill_pixels(px[area.y:area.y + area.h, area.x:area.x + area.w], rgba)
     else:
         w = min(width, r.w // 2, r.h // 2)
         t = _clip_rect(surface, Rect(r.x, r.y, r.w, w))
         if t.w > 0 and t.h > 0:
-            px[t.y:t.y + t.h, t.x:t.x + t.w] = rgba
+            _fill_pixels(px[t.y:t.y + t.h, t.x:t.x + t.w], rgba)
         t = _clip_rect(surface, Rect(r.x, r.y + r.h - w, r.w, w))
         if t.w > 0 and t.h > 0:
-            px[t.y:t.y + t.h, t.x:t.x + t.w] = rgba
+            _fill_pixels(px[t.y:t.y + t.h, t.x:t.x + t.w], rgba)
         t = _clip_rect(surface, Rect(r.x, r.y + w, w, r.h - 2 * w))
         if t.w > 0 and t.h > 0:
-            px[t.y:t.y + t.h, t.x:t.x + t.w] = rgba
+            _fill_pixels(px[t.y:t.y + t.h, t.x:t.x + t.w], rgba)
         t = _clip_rect(surface, Rect(r.x + r.w - w, r.y + w, w, r.h - 2 * w))
         if t.w > 0 and t.h > 0:
-            px[t.y:t.y + t.h, t.x:t.x + t.w] = rgba
+            _fill_pixels(px[t.y:t.y + t.h, t.x:t.x + t.w], rgba)
 
     return area
 
@@ -96,18 +102,38 @@ def circle(
         clip = _clip_rect(surface, bounding)
         if clip.w <= 0 or clip.h <= 0:
             return clip
-        yy, xx = np.ogrid[clip.y:clip.y + clip.h, clip.x:clip.x + clip.w]
-        dist_sq = (xx - cx) ** 2 + (yy - cy) ** 2
-        mask = dist_sq <= r * r
-        px[clip.y:clip.y + clip.h, clip.x:clip.x + clip.w][mask] = rgba
+        _fill_disk(px, cx, cy, r, clip, rgba)
     else:
         _draw_circle_outline(px, cx, cy, r, width, rgba, h, w)
 
     return _clip_rect(surface, bounding)
 
 
+def _fill_disk(px, cx, cy, r, clip, rgba):
+    """Fill the pixels with ``dx*dx + dy*dy <= r*r``, one span store per row."""
+    try:
+        dst = px.view(np.uint32)[..., 0]
+        value = _native_pixel(*rgba)
+    except ValueError:
+        dst = px
+        value = rgba
+    left = clip.x
+    right = clip.x + clip.w
+    rr = r * r
+    for y in range(clip.y, clip.y + clip.h):
+        dy = y - cy
+        span = math.isqrt(rr - dy * dy)
+        x0 = max(left, cx - span)
+        x1 = min(right, cx + span + 1)
+        if x0 < x1:
+            dst[y, x0:x1] = value
+
+
 def _draw_circle_outline(px, cx, cy, r, width, rgba, h, w):
     """Midpoint circle algorithm with thickness."""
+    # Walk one octant per ring in Python, then mirror all rings at once.
+    ox: list[int] = []
+    oy: list[int] = []
     for t in range(width):
         cr = r - t
         if cr < 0:
@@ -115,15 +141,21 @@ def _draw_circle_outline(px, cx, cy, r, width, rgba, h, w):
         x, y = 0, cr
         d = 1 - cr
         while x <= y:
-            for sx, sy in [(x, y), (y, x), (-x, y), (-y, x),
-                           (x, -y), (y, -x), (-x, -y), (-y, -x)]:
-                _set_pixel(px, cx + sx, cy + sy, rgba, h, w)
+            ox.append(x)
+            oy.append(y)
             x += 1
             if d < 0:
                 d += 2 * x + 1
             else:
                 y -= 1
                 d += 2 * (x - y) + 1
+    if not ox:
+        return
+    xs = np.array(ox)
+    ys = np.array(oy)
+    sx = np.concatenate([xs, ys, -xs, -ys, xs, ys, -xs, -ys])
+    sy = np.concatenate([ys, xs, ys, xs, -ys, -xs, -ys, -xs])
+    _set_pixels(px, cx + sx, cy + sy, rgba, h, w)
 
 
 def ellipse(
@@ -164,11 +196,10 @@ def _draw_ellipse_outline(px, cx, cy, rx, ry, rgba, h, w):
     if rx <= 0 or ry <= 0:
         return
     steps = max(int(2 * math.pi * max(rx, ry)), 60)
-    for i in range(steps):
-        angle = 2 * math.pi * i / steps
-        x = int(round(cx + rx * math.cos(angle)))
-        y = int(round(cy + ry * math.sin(angle)))
-        _set_pixel(px, x, y, rgba, h, w)
+    angles = 2 * math.pi * np.arange(steps) / steps
+    xs = np.rint(cx + rx * np.cos(angles)).astype(np.intp)
+    ys = np.rint(cy + ry * np.sin(angles)).astype(np.intp)
+    _set_pixels(px, xs, ys, rgba, h, w)
 
 
 def arc(
@@ -205,11 +236,10 @@ def arc(
         if crx <= 0 or cry <= 0:
             break
         steps = max(int((stop_angle - start_angle) * max(crx, cry)), 30)
-        for i in range(steps + 1):
-            angle = start_angle + (stop_angle - start_angle) * i / steps
-            x = int(round(cx + crx * math.cos(angle)))
-            y = int(round(cy - cry * math.sin(angle)))
-            _set_pixel(px, x, y, rgba, h, w)
+        angles = start_angle + (stop_angle - start_angle) * np.arange(steps + 1) / steps
+        xs = np.rint(cx + crx * np.cos(angles)).astype(np.intp)
+        ys = np.rint(cy - cry * np.sin(angles)).astype(np.intp)
+        _set_pixels(px, xs, ys, rgba, h, w)
 
     return clip
 
@@ -225,24 +255,7 @@ def line(
     rgba = _color_to_rgba(color)
     x0, y0 = int(start_pos[0]), int(start_pos[1])
     x1, y1 = int(end_pos[0]), int(end_pos[1])
-    px = surface._pixels
-    h, w = px.shape[:2]
-
-    if width <= 1:
-        _bresenham(px, x0, y0, x1, y1, rgba, h, w)
-    else:
-        dx = x1 - x0
-        dy = y1 - y0
-        length = math.hypot(dx, dy)
-        if length == 0:
-            _set_pixel(px, x0, y0, rgba, h, w)
-        else:
-            nx = -dy / length
-            ny = dx / length
-            for i in range(-(width // 2), width - width // 2):
-                ox = round(nx * i)
-                oy = round(ny * i)
-                _bresenham(px, x0 + ox, y0 + oy, x1 + ox, y1 + oy, rgba, h, w)
+    _line(surface._pixels, rgba, x0, y0, x1, y1, width)
 
     bx = min(x0, x1) - width
     by = min(y0, y1) - width
@@ -251,12 +264,46 @@ def line(
     return _clip_rect(surface, Rect(bx, by, bw, bh))
 
 
+def _line(px, rgba, x0: int, y0: int, x1: int, y1: int, width: int) -> None:
+    h, w = px.shape[:2]
+    if width <= 1:
+        _bresenham(px, x0, y0, x1, y1, rgba, h, w)
+        return
+    dx = x1 - x0
+    dy = y1 - y0
+    length = math.hypot(dx, dy)
+    if length == 0:
+        _set_pixel(px, x0, y0, rgba, h, w)
+        return
+    nx = -dy / length
+    ny = dx / length
+    offsets = [(round(nx * i), round(ny * i))
+               for i in range(-(width // 2), width - width // 2)]
+    if (max(abs(dx), abs(dy)) + 1) * width < _VECTOR_LINE_MIN:
+        for ox, oy in offsets:
+            _bresenham(px, x0 + ox, y0 + oy, x1 + ox, y1 + oy, rgba, h, w)
+        return
+    # Bresenham only depends on (dx, dy), so every parallel stroke is the
+    # same pixel run translated: rasterise once, store all copies at once.
+    xs, ys = _bresenham_points(x0, y0, x1, y1)
+    ox, oy = np.array(offsets).T
+    _set_pixels(px, (xs + ox[:, None]).ravel(), (ys + oy[:, None]).ravel(), rgba, h, w)
+
+
+# Below these lengths the per-pixel Python loops beat NumPy's setup cost.
+_VECTOR_LINE_MIN = 24
+_VECTOR_AALINE_MIN = 16
+
+
 def _bresenham(px, x0, y0, x1, y1, rgba, h, w):
     """Bresenham's line algorithm."""
     dx = abs(x1 - x0)
     dy = -abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
+    if max(dx, -dy) >= _VECTOR_LINE_MIN:
+        _set_pixels(px, *_bresenham_points(x0, y0, x1, y1), rgba, h, w)
+        return
     err = dx + dy
     while True:
         _set_pixel(px, x0, y0, rgba, h, w)
@@ -271,6 +318,48 @@ def _bresenham(px, x0, y0, x1, y1, rgba, h, w):
             y0 += sy
 
 
+def _bresenham_points(x0, y0, x1, y1):
+    """Return the pixels of ``_bresenham`` as (xs, ys) arrays.
+
+    At major-axis step *i* Bresenham's minor-axis offset is
+    ``(2*i*minor + major) // (2*major)``.
+    """
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    if dx >= dy:
+        i = np.arange(dx + 1)
+        if not dx:
+            return x0 + i, y0 + i
+        return x0 + sx * i, y0 + sy * ((2 * dy * i + dx) // (2 * dx))
+    i = np.arange(dy + 1)
+    return x0 + sx * ((2 * dx * i + dy) // (2 * dy)), y0 + sy * i
+
+
+def _bresenham_segments(x0s, y0s, x1s, y1s):
+    """``_bresenham_points`` for many segments at once, concatenated."""
+    x0s = np.asarray(x0s, dtype=np.int64)
+    y0s = np.asarray(y0s, dtype=np.int64)
+    x1s = np.asarray(x1s, dtype=np.int64)
+    y1s = np.asarray(y1s, dtype=np.int64)
+    dx = np.abs(x1s - x0s)
+    dy = np.abs(y1s - y0s)
+    x_major = dx >= dy
+    major = np.where(x_major, dx, dy)
+    minor = np.where(x_major, dy, dx)
+    counts = major + 1
+    seg = np.repeat(np.arange(len(counts)), counts)
+    i = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    major = major[seg]
+    # A zero-length segment has i == minor == 0, so any nonzero divisor works.
+    m = (2 * minor[seg] * i + major) // np.maximum(2 * major, 1)
+    x_major = x_major[seg]
+    xs = x0s[seg] + np.where(x0s < x1s, 1, -1)[seg] * np.where(x_major, i, m)
+    ys = y0s[seg] + np.where(y0s < y1s, 1, -1)[seg] * np.where(x_major, m, i)
+    return xs, ys
+
+
 def lines(
     surface: Surface,
     color,
@@ -282,15 +371,20 @@ def lines(
     if len(points) < 2:
         raise ValueError("points must contain at least 2 points")
     rgba = _color_to_rgba(color)
-    rects = []
-    for i in range(len(points) - 1):
-        rects.append(line(surface, rgba, points[i], points[i + 1], width))
-    if closed and len(points) > 2:
-        rects.append(line(surface, rgba, points[-1], points[0], width))
-    result = rects[0]
-    for r in rects[1:]:
-        result = result.union(r)
-    return result
+    px = surface._pixels
+    pts = [(int(p[0]), int(p[1])) for p in points]
+    for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+        _line(px, rgba, x0, y0, x1, y1, width)
+    if closed and len(pts) > 2:
+        _line(px, rgba, *pts[-1], *pts[0], width)
+
+    # Every point is a segment end, so their extent bounds all segments.
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    min_x, min_y = min(xs), min(ys)
+    return _clip_rect(surface, Rect(min_x - width, min_y - width,
+                                     max(xs) - min_x + 2 * width,
+                                     max(ys) - min_y + 2 * width))
 
 
 def aaline(
@@ -348,24 +442,55 @@ def _wu_line(px, x0, y0, x1, y1, rgba, h, w):
     else:
         _blend_pixel(px, xpxl2, ypxl2, rgba, 1.0, h, w)
 
-    for x in range(xpxl1 + 1, xpxl2):
-        ipart = int(math.floor(intery))
-        fpart = intery - ipart
-        if steep:
-            _blend_pixel(px, ipart, x, rgba, 1 - fpart, h, w)
-            _blend_pixel(px, ipart + 1, x, rgba, fpart, h, w)
-        else:
-            _blend_pixel(px, x, ipart, rgba, 1 - fpart, h, w)
-            _blend_pixel(px, x, ipart + 1, rgba, fpart, h, w)
-        intery += gradient
+    n = xpxl2 - xpxl1 - 1
+    if n < _VECTOR_AALINE_MIN:
+        for x in range(xpxl1 + 1, xpxl2):
+            ipart = int(math.floor(intery))
+            fpart = intery - ipart
+            if steep:
+                _blend_pixel(px, ipart, x, rgba, 1 - fpart, h, w)
+                _blend_pixel(px, ipart + 1, x, rgba, fpart, h, w)
+            else:
+                _blend_pixel(px, x, ipart, rgba, 1 - fpart, h, w)
+                _blend_pixel(px, x, ipart + 1, rgba, fpart, h, w)
+            intery += gradient
+        return
+
+    xs = np.arange(xpxl1 + 1, xpxl2)
+    # cumsum adds sequentially, matching an ``intery += gradient`` loop.
+    intery = np.cumsum(np.concatenate(([intery], np.full(n - 1, gradient))))
+    ipart = np.floor(intery).astype(np.intp)
+    fpart = intery - ipart
+    if steep:
+        _blend_pixels(px, ipart, xs, rgba, 1 - fpart, h, w)
+        _blend_pixels(px, ipart + 1, xs, rgba, fpart, h, w)
+    else:
+        _blend_pixels(px, xs, ipart, rgba, 1 - fpart, h, w)
+        _blend_pixels(px, xs, ipart + 1, rgba, fpart, h, w)
+
+
+def _blend_pixels(px, xs, ys, rgba, alpha, h, w):
+    """Vector form of ``_blend_pixel``; (xs, ys) pairs must be distinct."""
+    inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    xs = xs[inside]
+    ys = ys[inside]
+    # 255 * 256 still fits in uint16, so the whole blend stays integer.
+    a = (alpha[inside] * 256).astype(np.uint16)[:, None]
+    existing = px[ys, xs].astype(np.uint16)
+    new = np.array(rgba, dtype=np.uint16)
+    px[ys, xs] = (existing * (256 - a) + new * a) >> 8
 
 
 def _blend_pixel(px, x, y, rgba, alpha, h, w):
     """Blend *rgba* into pixel at (x, y) with *alpha* (0-1)."""
     if 0 <= x < w and 0 <= y < h:
-        existing = px[y, x].astype(np.float32)
-        new = np.array(rgba, dtype=np.float32)
-        px[y, x] = (existing * (1 - alpha) + new * alpha).astype(np.uint8)
+        a = int(alpha * 256)
+        ia = 256 - a
+        r, g, b, da = px[y, x].tolist()
+        px[y, x] = ((r * ia + rgba[0] * a) >> 8,
+                    (g * ia + rgba[1] * a) >> 8,
+                    (b * ia + rgba[2] * a) >> 8,
+                    (da * ia + rgba[3] * a) >> 8)
 
 
 def aalines(
@@ -377,15 +502,26 @@ def aalines(
     """Draw multiple connected anti-aliased lines."""
     if len(points) < 2:
         raise ValueError("points must contain at least 2 points")
-    rects = []
-    for i in range(len(points) - 1):
-        rects.append(aaline(surface, color, points[i], points[i + 1]))
-    if closed and len(points) > 2:
-        rects.append(aaline(surface, color, points[-1], points[0]))
-    result = rects[0]
-    for r in rects[1:]:
-        result = result.union(r)
-    return result
+    rgba = _color_to_rgba(color)
+    px = surface._pixels
+    h, w = px.shape[:2]
+    pts = [(float(p[0]), float(p[1])) for p in points]
+    segments = list(zip(pts, pts[1:]))
+    if closed and len(pts) > 2:
+        segments.append((pts[-1], pts[0]))
+
+    # Same per-segment box as aaline(), accumulated as plain ints.
+    left = top = math.inf
+    right = bottom = -math.inf
+    for (x0, y0), (x1, y1) in segments:
+        _wu_line(px, x0, y0, x1, y1, rgba, h, w)
+        bx = int(min(x0, x1))
+        by = int(min(y0, y1))
+        left = min(left, bx)
+        top = min(top, by)
+        right = max(right, bx + int(abs(x1 - x0)) + 2)
+        bottom = max(bottom, by + int(abs(y1 - y0)) + 2)
+    return _clip_rect(surface, Rect(left, top, right - left, bottom - top))
 
 
 def polygon(
@@ -412,14 +548,25 @@ def polygon(
                                      max(ys) - min(ys) + 1))
 
 
+_VECTOR_POLYGON_MIN = 256
+# Upper bound on rows x edges handled per band by ``_fill_polygon_vector``.
+_POLYGON_BAND_CELLS = 1 << 20
+
+
 def _fill_polygon(px, pts, rgba):
     """Scanline polygon fill."""
     h, w = px.shape[:2]
     ys = [p[1] for p in pts]
     ymin = max(0, min(ys))
     ymax = min(h - 1, max(ys))
+    if ymin > ymax:
+        return
 
     n = len(pts)
+    if (ymax - ymin + 1) * n >= _VECTOR_POLYGON_MIN:
+        _fill_polygon_vector(px, pts, rgba, ymin, ymax)
+        return
+
     for y in range(ymin, ymax + 1):
         intersections = []
         for i in range(n):
@@ -440,3 +587,53 @@ def _fill_polygon(px, pts, rgba):
             x_end = min(w - 1, int(math.floor(intersections[k + 1])))
             if x_start <= x_end:
                 px[y, x_start:x_end + 1] = rgba
+
+
+def _fill_polygon_vector(px, pts, rgba, ymin, ymax):
+    """``_fill_polygon`` for large polygons: bands of rows x edges at once."""
+    w = px.shape[1]
+    p = np.asarray(pts, dtype=np.int64)
+    q = np.roll(p, -1, axis=0)
+    # Edges oriented top to bottom; horizontal edges never cross a scanline.
+    flip = p[:, 1] > q[:, 1]
+    x0 = np.where(flip, q[:, 0], p[:, 0])
+    y0 = np.where(flip, q[:, 1], p[:, 1])
+    x1 = np.where(flip, p[:, 0], q[:, 0])
+    y1 = np.where(flip, p[:, 1], q[:, 1])
+    keep = y0 != y1
+    x0, y0, x1, y1 = x0[keep], y0[keep], x1[keep], y1[keep]
+    dx = x1 - x0
+    dy = y1 - y0
+
+    try:
+        dst = px.view(np.uint32)[..., 0]
+        value = _native_pixel(*rgba)
+    except ValueError:
+        dst = px
+        value = rgba
+
+    # Bound the rows x edges temporaries so huge polygons stay within memory.
+    band = max(1, _POLYGON_BAND_CELLS // max(1, len(x0)))
+    for top in range(ymin, ymax + 1, band):
+        bottom = min(top + band, ymax + 1)
+        near = (y0 < bottom) & (y1 > top)
+        if not near.any():
+            continue
+        bx0, by0, by1 = x0[near], y0[near], y1[near]
+        bdx, bdy = dx[near], dy[near]
+
+        # Edges that don't span a row get +inf so they sort past the real hits.
+        y = np.arange(top, bottom)[:, None]
+        active = (by0 <= y) & (y < by1)
+        xs = np.where(active, bx0 + (y - by0) * bdx / bdy, np.inf)
+        xs.sort(axis=1)
+        ends = xs[:, 1::2]
+        starts = xs[:, 0:2 * ends.shape[1]:2]
+        valid = np.isfinite(ends)
+        starts = np.maximum(0, np.ceil(starts[valid])).astype(np.intp)
+        ends = np.minimum(w - 1, np.floor(ends[valid])).astype(np.intp)
+        rows = np.nonzero(valid)[0] + top
+
+        for y, a, b in zip(rows.tolist(), starts.tolist(), ends.tolist()):
+            if a <= b:
+                dst[y, a:b + 1] = value
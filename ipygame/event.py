@@ -25,9 +25,10 @@ class Event:
 
     def __init__(self, event_type: int, attributes: dict | None = None, **kwargs):
         self.type = event_type
+        # kwargs is already a fresh dict, so adopt it rather than copy it.
         if attributes:
-            self.__dict__.update(attributes)
-        self.__dict__.update(kwargs)
+            kwargs = {**attributes, **kwargs}
+        self.__dict__ = kwargs
 
     @property
     def dict(self) -> dict:
@@ -50,11 +51,26 @@ class Event:
         return self.type != _c.NOEVENT
 
 
+def _make_event(event_type: int, attributes: dict) -> Event:
+    """Build an Event that takes ownership of *attributes* (no copying)."""
+    ev = Event.__new__(Event)
+    ev.type = event_type
+    ev.__dict__ = attributes
+    return ev
+
+
 _event_queue: collections.deque[Event] = collections.deque()
 _blocked: set[int] = set()
 _allowed: set[int] | None = None
 _grab: bool = False
 _custom_type_counter = itertools.count(_c.USEREVENT + 1)
+# Fold canvas mouse moves into a queued MOUSEMOTION at the tail of the
+# queue (summing ``rel``) instead of queuing one event per move.
+_coalesce_motion: bool = True
+# The MOUSEMOTION most recently queued by the canvas callback, while it is
+# still in the queue.  Only this event is ever coalesced into, so events
+# posted by user code are never modified.
+_last_motion: Event | None = None
 
 
 def pump() -> None:
@@ -68,7 +84,14 @@ def get(eventtype=None, pump: bool = True, exclude=None) -> list[Event]:
     *eventtype* can be a single type ``int``, a sequence of types, or
     ``None`` (all events).
     """
+    global _last_motion
     if eventtype is None:
+        if exclude is None:
+            # Draining everything is the common per-frame call.
+            result = list(_event_queue)
+            _event_queue.clear()
+            _last_motion = None
+            return result
         types = None
     elif isinstance(eventtype, int):
         types = {eventtype}
@@ -88,6 +111,8 @@ def get(eventtype=None, pump: bool = True, exclude=None) -> list[Event]:
         match = (types is None or ev.type in types) and ev.type not in excl
         if match:
             result.append(ev)
+            if ev is _last_motion:
+                _last_motion = None
         else:
             remaining.append(ev)
     _event_queue.clear()
@@ -97,8 +122,12 @@ def get(eventtype=None, pump: bool = True, exclude=None) -> list[Event]:
 
 def poll() -> Event:
     """Get a single event from the queue (or ``NOEVENT``)."""
+    global _last_motion
     if _event_queue:
-        return _event_queue.popleft()
+        ev = _event_queue.popleft()
+        if ev is _last_motion:
+            _last_motion = None
+        return ev
     return Event(_c.NOEVENT)
 
 
@@ -119,8 +148,10 @@ def peek(eventtype=None) -> bool:
 
 def clear(eventtype=None) -> None:
     """Remove events from the queue."""
+    global _last_motion
     if eventtype is None:
         _event_queue.clear()
+        _last_motion = None
     else:
         get(eventtype)
 
@@ -226,26 +257,47 @@ _JS_KEY_MAP: dict[str, int] = {
     "F9": _c.K_F9, "F10": _c.K_F10, "F11": _c.K_F11, "F12": _c.K_F12,
 }
 
-for _ch in "abcdefghijklmnopqrstuvwxyz":
-    _JS_KEY_MAP[_ch] = getattr(_c, f"K_{_ch}")
-    _JS_KEY_MAP[_ch.upper()] = getattr(_c, f"K_{_ch}")
-for _d in "0123456789":
-    _JS_KEY_MAP[_d] = getattr(_c, f"K_{_d}")
+_JS_KEY_MAP.update({_ch: getattr(_c, f"K_{_ch}")
+                    for _ch in "abcdefghijklmnopqrstuvwxyz0123456789"})
+_JS_KEY_MAP.update({_ch.upper(): getattr(_c, f"K_{_ch}")
+                    for _ch in "abcdefghijklmnopqrstuvwxyz"})
+
+# Bound once for the key callbacks: ``_key_code(key, _K_UNKNOWN)``.
+_key_code = _JS_KEY_MAP.get
+_K_UNKNOWN = _c.K_UNKNOWN
+
+
+_MOD_BITS = (
+    ("shiftKey", _c.KMOD_SHIFT),
+    ("ctrlKey", _c.KMOD_CTRL),
+    ("altKey", _c.KMOD_ALT),
+    ("metaKey", _c.KMOD_GUI),
+)
+
+# KMOD value for every (shift, ctrl, meta) combination, indexed by
+# shift | ctrl << 1 | meta << 2 -- the flags ipycanvas key callbacks pass.
+_MODS_BY_FLAGS = tuple(
+    (_c.KMOD_SHIFT if i & 1 else 0)
+    | (_c.KMOD_CTRL if i & 2 else 0)
+    | (_c.KMOD_GUI if i & 4 else 0)
+    for i in range(8)
+)
 
 
 def _get_mods_from_event(info: dict) -> int:
     mods = _c.KMOD_NONE
-    if info.get("shiftKey"):
-        mods |= _c.KMOD_SHIFT
-    if info.get("ctrlKey"):
-        mods |= _c.KMOD_CTRL
-    if info.get("altKey"):
-        mods |= _c.KMOD_ALT
-    if info.get("metaKey"):
-        mods |= _c.KMOD_GUI
+    for name, bit in _MOD_BITS:
+        if info.get(name):
+            mods |= bit
     return mods
 
 
+def _mods_from_flags(shift_key, ctrl_key, meta_key) -> int:
+    return _MODS_BY_FLAGS[(1 if shift_key else 0)
+                          | (2 if ctrl_key else 0)
+                          | (4 if meta_key else 0)]
+
+
 def _wire_canvas_events(canvas) -> None:
     """Register ipycanvas callbacks that translate to pygame events."""
     from ipygame import key as _key_mod
@@ -254,51 +306,51 @@ def _wire_canvas_events(canvas) -> None:
     _key_mod._set_key_up_supported(hasattr(canvas, "on_key_up"))
 
     def _on_mouse_move(x, y):
+        global _last_motion
         ix, iy = int(x), int(y)
         _mouse_mod._update_pos(ix, iy)
         buttons = tuple(_mouse_mod._buttons[:3])
         rel = (_mouse_mod._rel[0], _mouse_mod._rel[1])
-        post(Event(_c.MOUSEMOTION,
-                    pos=(ix, iy), rel=rel, buttons=buttons))
+        if (_coalesce_motion and _event_queue
+                and _event_queue[-1] is _last_motion
+                and _c.MOUSEMOTION not in _blocked):
+            tail = _last_motion
+            if tail.buttons == buttons:
+                trel = tail.rel
+                tail.pos = (ix, iy)
+                tail.rel = (trel[0] + rel[0], trel[1] + rel[1])
+                return
+        ev = _make_event(_c.MOUSEMOTION,
+                         {"pos": (ix, iy), "rel": rel, "buttons": buttons})
+        if post(ev):
+            _last_motion = ev
 
     def _on_mouse_down(x, y):
         ix, iy = int(x), int(y)
         _mouse_mod._update_pos(ix, iy)
         _mouse_mod._button_down(_c.BUTTON_LEFT)
-        post(Event(_c.MOUSEBUTTONDOWN,
-                    pos=(ix, iy), button=_c.BUTTON_LEFT))
+        post(_make_event(_c.MOUSEBUTTONDOWN,
+                         {"pos": (ix, iy), "button": _c.BUTTON_LEFT}))
 
     def _on_mouse_up(x, y):
         ix, iy = int(x), int(y)
         _mouse_mod._update_pos(ix, iy)
         _mouse_mod._button_up(_c.BUTTON_LEFT)
-        post(Event(_c.MOUSEBUTTONUP,
-                    pos=(ix, iy), button=_c.BUTTON_LEFT))
+        post(_make_event(_c.MOUSEBUTTONUP,
+                         {"pos": (ix, iy), "button": _c.BUTTON_LEFT}))
 
     def _on_key_down(key, shift_key, ctrl_key, meta_key):
-        k = _JS_KEY_MAP.get(key, _c.K_UNKNOWN)
-        mods = _c.KMOD_NONE
-        if shift_key:
-            mods |= _c.KMOD_SHIFT
-        if ctrl_key:
-            mods |= _c.KMOD_CTRL
-        if meta_key:
-            mods |= _c.KMOD_GUI
+        k = _key_code(key, _K_UNKNOWN)
+        mods = _mods_from_flags(shift_key, ctrl_key, meta_key)
         _key_mod._key_down(k, mods)
-        post(Event(_c.KEYDOWN, key=k, mod=mods,
-                    unicode=key if len(key) == 1 else ""))
+        post(_make_event(_c.KEYDOWN, {"key": k, "mod": mods,
+                                      "unicode": key if len(key) == 1 else ""}))
 
     def _on_key_up(key, shift_key, ctrl_key, meta_key):
-        k = _JS_KEY_MAP.get(key, _c.K_UNKNOWN)
-        mods = _c.KMOD_NONE
-        if shift_key:
-            mods |= _c.KMOD_SHIFT
-        if ctrl_key:
-            mods |= _c.KMOD_CTRL
-        if meta_key:
-            mods |= _c.KMOD_GUI
+        k = _key_code(key, _K_UNKNOWN)
+        mods = _mods_from_flags(shift_key, ctrl_key, meta_key)
         _key_mod._key_up(k, mods)
-        post(Event(_c.KEYUP, key=k, mod=mods))
+        post(_make_event(_c.KEYUP, {"key": k, "mod": mods}))
 
     canvas.on_mouse_move(_on_mouse_move)
     canvas.on_mouse_down(_on_mouse_down)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
@@ -49,8 +50,14 @@ def get_default_font() -> str:
     return _DEFAULT_FONT_NAME
 
 
-def _find_system_font_dirs() -> list[Path]:
-    """Return platform-specific system font directories."""
+@lru_cache(maxsize=1)
+def _find_system_font_dirs() -> tuple[Path, ...]:
+    """Return platform-specific system font directories.
+
+    Symlinked duplicates (e.g. ``~/.fonts`` -> ``~/.local/share/fonts``) are
+    dropped so no directory is scanned twice. Missing directories are kept;
+    the index records them so creating one later triggers a rescan.
+    """
     dirs = []
     if sys.platform == "win32":
         windir = os.environ.get("WINDIR", r"C:\Windows")
@@ -71,41 +78,124 @@ def _find_system_font_dirs() -> list[Path]:
             Path.home() / ".local" / "share" / "fonts",
             Path.home() / ".fonts",
         ])
-    return dirs
+    unique: dict[str, Path] = {}
+    for d in dirs:
+        unique.setdefault(os.path.realpath(d), d)
+    return tuple(unique.values())
+
+
+_FONT_SUFFIXES = (".ttf", ".otf", ".ttc")
+
+# stem (lowercase, spaces removed) -> font files, in scan order.
+_FONT_INDEX: dict[str, list[str]] | None = None
+# mtime of every directory walked to build _FONT_INDEX (None if missing).
+_FONT_INDEX_MTIME: dict[str, float | None] = {}
+
+
+def _dir_mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _index_is_stale() -> bool:
+    for path, mtime in _FONT_INDEX_MTIME.items():
+        if _dir_mtime(path) != mtime:
+            return True
+    return False
+
+
+def _iter_font_files(root: str, mtimes: dict[str, float | None]):
+    """Yield ``(stem, path)`` for every font file under *root*.
+
+    Uses ``os.scandir`` so file types come from the directory entries instead
+    of a ``stat`` per file; only directories are stat'ed, for *mtimes*.
+    """
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        mtimes[d] = _dir_mtime(d)
+        if mtimes[d] is None:
+            continue
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(_FONT_SUFFIXES):
+                # Every suffix is four characters long.
+                yield entry.name[:-4], entry.path
+        stack.extend(reversed(subdirs))
+
+
+def _get_font_index() -> dict[str, list[str]]:
+    """Return the system font index, rescanning only when a directory changed.
+
+    Adding or removing a file updates the mtime of its parent directory, so
+    every walked directory is recorded and checked instead of just the roots.
+    """
+    global _FONT_INDEX
+    if _FONT_INDEX is not None and not _index_is_stale():
+        return _FONT_INDEX
+
+    index: dict[str, list[str]] = {}
+    mtimes: dict[str, float | None] = {}
+    for d in _find_system_font_dirs():
+        for stem, path in _iter_font_files(str(d), mtimes):
+            index.setdefault(stem.lower().replace(" ", ""), []).append(path)
+
+    _FONT_INDEX_MTIME.clear()
+    _FONT_INDEX_MTIME.update(mtimes)
+    _FONT_INDEX = index
+    return index
 
 
 def get_fonts() -> list[str]:
     """List available system font names (lowercase, no extension)."""
-    fonts: set[str] = set()
-    for d in _find_system_font_dirs():
-        if d.is_dir():
-            for f in d.rglob("*"):
-                if f.suffix.lower() in (".ttf", ".otf", ".ttc"):
-                    fonts.add(f.stem.lower().replace(" ", ""))
-    return sorted(fonts)
+    return sorted(_get_font_index())
 
 
 def match_font(name: str, bold: bool = False, italic: bool = False) -> str | None:
     """Find a specific system font file path."""
     target = name.lower().replace(" ", "")
-    for d in _find_system_font_dirs():
-        if not d.is_dir():
-            continue
-        for f in d.rglob("*"):
-            if f.suffix.lower() not in (".ttf", ".otf", ".ttc"):
+    index = _get_font_index()
+    paths = index.get(target)
+    if paths and not bold and not italic:
+        return paths[0]
+    for stem, paths in index.items():
+        if target in stem:
+            if bold and "bold" not in stem:
+                continue
+            if italic and ("italic" not in stem and "oblique" not in stem):
                 continue
-            stem = f.stem.lower().replace(" ", "")
-            if target in stem:
-                if bold and "bold" not in stem:
-                    continue
-                if italic and ("italic" not in stem and "oblique" not in stem):
-                    continue
-                return str(f)
+            return paths[0]
     if bold or italic:
         return match_font(name, bold=False, italic=False)
     return None
 
 
+@lru_cache(maxsize=64)
+def _open_face(path: str | None, size: int):
+    """Load a Pillow font face, shared by every Font with the same file and size.
+
+    Faces are only read by ``Font``, so one object per (path, size) is enough;
+    the fallback default face in particular is decoded once instead of per Font.
+    """
+    from PIL import ImageFont
+
+    if path is None:
+        try:
+            return ImageFont.truetype("arial.ttf", size)
+        except (OSError, IOError):
+            return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
 def SysFont(name: str | Sequence[str] | None, size: int,
             bold: bool = False, italic: bool = False,
             constructor=None) -> "Font":
@@ -128,26 +218,25 @@ def SysFont(name: str | Sequence[str] | None, size: int,
     return constructor(None, size)
 
 
+# Words whose advance width a Font remembers before starting over.
+_WORD_WIDTH_CACHE_SIZE = 1024
+
+
 class Font:
     """TrueType font rendering using Pillow."""
 
     def __init__(self, filename: str | Path | None = None, size: int = 20):
-        from PIL import ImageFont
-
         self._size = max(1, int(size))
         self._bold = False
         self._italic = False
         self._underline = False
         self._strikethrough = False
         self._align = 0  # LEFT
+        self._word_width_cache: dict[str, float] = {}
+        self._metrics_cache: dict[str, tuple[int, int, int, int] | None] = {}
 
-        if filename is None:
-            try:
-                self._font = ImageFont.truetype("arial.ttf", self._size)
-            except (OSError, IOError):
-                self._font = ImageFont.load_default()
-        else:
-            self._font = ImageFont.truetype(str(filename), self._size)
+        self._font = _open_face(None if filename is None else str(filename),
+                                self._size)
 
     @property
     def name(self) -> str:
@@ -198,12 +287,13 @@ class Font:
     @point_size.setter
     def point_size(self, value: int):
         self._size = max(1, int(value))
-        from PIL import ImageFont
         try:
             path = self._font.path
-            self._font = ImageFont.truetype(path, self._size)
+            self._font = _open_face(path, self._size)
         except (AttributeError, OSError):
             pass
+        self._word_width_cache.clear()
+        self._metrics_cache.clear()
 
     def set_bold(self, value: bool) -> None:
         self._bold = value
@@ -236,9 +326,17 @@ class Font:
             return (0, self.get_height())
         return (bbox[2] - bbox[0], bbox[3] - bbox[1])
 
+    def _sample_bbox(self, sample: str):
+        """``getbbox`` of a fixed sample string, cached per point size."""
+        try:
+            return self._metrics_cache[sample]
+        except KeyError:
+            bbox = self._metrics_cache[sample] = self._font.getbbox(sample)
+            return bbox
+
     def get_height(self) -> int:
         """Font height in pixels."""
-        bbox = self._font.getbbox("Ay")
+        bbox = self._sample_bbox("Ay")
         if bbox is None:
             return self._size
         return bbox[3] - bbox[1]
@@ -251,13 +349,13 @@ class Font:
         pass
 
     def get_ascent(self) -> int:
-        bbox = self._font.getbbox("A")
+        bbox = self._sample_bbox("A")
         if bbox is None:
             return self._size
         return bbox[3]
 
     def get_descent(self) -> int:
-        bbox = self._font.getbbox("gjpqy")
+        bbox = self._sample_bbox("gjpqy")
         if bbox is None:
             return 0
         return max(0, bbox[3] - self.get_height())
@@ -291,14 +389,17 @@ class Font:
                color=None, bgcolor=None,
                wraplength: int = 0) -> Surface:
         """Render text to a new Surface."""
-        from PIL import Image, ImageDraw
-
         if color is None:
             fg = (255, 255, 255, 255)
         else:
             c = Color(color) if not isinstance(color, Color) else color
             fg = (c.r, c.g, c.b, c.a)
 
+        if not text and wraplength <= 0:
+            return self._render_empty(fg, bgcolor)
+
+        from PIL import Image, ImageDraw
+
         if not text:
             text = " "
             empty = True
@@ -347,18 +448,54 @@ class Font:
         surf._pixels[:] = arr
         return surf
 
+    def _render_empty(self, fg, bgcolor) -> Surface:
+        """The one-column surface ``render("")`` produces, without PIL."""
+        bbox = self._sample_bbox(" ")
+        th = self.get_height() if bbox is None else bbox[3] - bbox[1]
+        h = max(th + 2, 1)
+        surf = Surface((1, h))
+        column = surf._pixels[:, 0]
+        if bgcolor is not None:
+            bg = Color(bgcolor) if not isinstance(bgcolor, Color) else bgcolor
+            column[:] = (bg.r, bg.g, bg.b, bg.a)
+        if self._underline and 0 <= self.get_linesize() - 2 < h:
+            column[self.get_linesize() - 2] = fg
+        if self._strikethrough and 0 <= th // 2 < h:
+            column[th // 2] = fg
+        return surf
+
+    def _word_width(self, word: str) -> float:
+        cache = self._word_width_cache
+        width = cache.get(word)
+        if width is None:
+            # Changing text (scores, timers) would otherwise grow this forever.
+            if len(cache) >= _WORD_WIDTH_CACHE_SIZE:
+                cache.clear()
+            width = cache[word] = self._font.getlength(word)
+        return width
+
     def _wrap_text(self, text: str, max_width: int) -> list[str]:
-        words = text.split(" ")
+        # Advance widths add up, so each word is measured once rather than
+        # re-measuring the whole line after every word.
+        space_w = self._word_width(" ")
         lines: list[str] = []
         current = ""
-        for word in words:
-            test = f"{current} {word}".strip() if current else word
-            tw, _ = self.size(test)
-            if tw <= max_width or not current:
-                current = test
+        current_w = 0.0
+        for word in text.split(" "):
+            if not current:
+                current = word
+                current_w = self._word_width(word)
+                continue
+            if not word:
+                continue
+            word_w = self._word_width(word)
+            if current_w + space_w + word_w <= max_width:
+                current = f"{current} {word}"
+                current_w += space_w + word_w
             else:
                 lines.append(current)
                 current = word
+                current_w = word_w
         if current:
             lines.append(current)
         return lines if lines else [""]
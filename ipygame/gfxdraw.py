@@ -7,8 +7,16 @@ import math as _math
 import numpy as np
 
 from ipygame.color import Color
+from ipygame.draw import (
+    _VECTOR_AALINE_MIN,
+    _blend_pixel,
+    _blend_pixels,
+    _bresenham,
+    _bresenham_segments,
+    _set_pixels,
+)
 from ipygame.rect import Rect
-from ipygame.surface import Surface, _color_to_rgba
+from ipygame.surface import Surface, _color_to_rgba, _fill_pixels, _native_pixel
 
 __all__ = [
     "pixel",
@@ -35,6 +43,10 @@ __all__ = [
 ]
 
 
+# Below this many rows the per-row math.sqrt beats NumPy's call overhead.
+_VECTOR_ELLIPSE_MIN = 48
+
+
 def _clr(color) -> tuple[int, int, int, int]:
     if isinstance(color, Color):
         return (color.r, color.g, color.b, color.a)
@@ -42,61 +54,89 @@ def _clr(color) -> tuple[int, int, int, int]:
     return (c.r, c.g, c.b, c.a)
 
 
+def _pixel_target(px, color):
+    """Return ``(dst, value)`` such that ``dst[y, x] = value`` writes *color*.
+
+    ``dst`` is a uint32 view when possible so each store is a single word
+    rather than a 4-element broadcast.
+    """
+    try:
+        return px.view(np.uint32)[..., 0], _native_pixel(*color)
+    except ValueError:
+        return px, color
+
+
 def pixel(surface: Surface, x: int, y: int, color) -> None:
     """Draw a single pixel."""
-    r, g, b, a = _clr(color)
+    c = _clr(color)
     if 0 <= x < surface.width and 0 <= y < surface.height:
-        surface._pixels[y, x] = [r, g, b, a]
+        surface._pixels[y, x] = c
 
 
 def hline(surface: Surface, x1: int, x2: int, y: int, color) -> None:
     """Draw a horizontal line."""
-    r, g, b, a = _clr(color)
+    c = _clr(color)
     if y < 0 or y >= surface.height:
         return
     x1, x2 = max(0, min(x1, x2)), min(surface.width - 1, max(x1, x2))
     if x1 > x2:
         return
-    surface._pixels[y, x1:x2 + 1] = [r, g, b, a]
+    _fill_pixels(surface._pixels[y, x1:x2 + 1], c)
 
 
 def vline(surface: Surface, x: int, y1: int, y2: int, color) -> None:
     """Draw a vertical line."""
-    r, g, b, a = _clr(color)
+    c = _clr(color)
     if x < 0 or x >= surface.width:
         return
     y1, y2 = max(0, min(y1, y2)), min(surface.height - 1, max(y1, y2))
     if y1 > y2:
         return
-    surface._pixels[y1:y2 + 1, x] = [r, g, b, a]
+    _fill_pixels(surface._pixels[y1:y2 + 1, x], c)
 
 
 def line(surface: Surface, x1: int, y1: int, x2: int, y2: int, color) -> None:
     """Draw a line between two points."""
-    from ipygame.draw import line as draw_line
-    draw_line(surface, color, (x1, y1), (x2, y2))
+    c = _clr(color)
+    px = surface._pixels
+    h, w = px.shape[:2]
+    _bresenham(px, int(x1), int(y1), int(x2), int(y2), c, h, w)
 
 
 def rectangle(surface: Surface, rect, color) -> None:
     """Draw an unfilled rectangle."""
     r = Rect(rect)
     c = _clr(color)
-    hline(surface, r.left, r.right - 1, r.top, c)
-    hline(surface, r.left, r.right - 1, r.bottom - 1, c)
-    vline(surface, r.left, r.top, r.bottom - 1, c)
-    vline(surface, r.right - 1, r.top, r.bottom - 1, c)
+    px = surface._pixels
+    h, w = px.shape[:2]
+    left, right = r.left, r.right - 1
+    top, bottom = r.top, r.bottom - 1
+    # Clip once and write the four edges directly, as hline/vline would.
+    x1, x2 = max(0, min(left, right)), min(w - 1, max(left, right))
+    y1, y2 = max(0, min(top, bottom)), min(h - 1, max(top, bottom))
+    dst, value = _pixel_target(px, c)
+    if x1 <= x2:
+        if 0 <= top < h:
+            dst[top, x1:x2 + 1] = value
+        if 0 <= bottom < h:
+            dst[bottom, x1:x2 + 1] = value
+    if y1 <= y2:
+        if 0 <= left < w:
+            dst[y1:y2 + 1, left] = value
+        if 0 <= right < w:
+            dst[y1:y2 + 1, right] = value
 
 
 def box(surface: Surface, rect, color) -> None:
     """Draw a filled rectangle."""
     r = Rect(rect)
-    cr, cg, cb, ca = _clr(color)
+    c = _clr(color)
     x1 = max(0, r.left)
     y1 = max(0, r.top)
     x2 = min(surface.width, r.right)
     y2 = min(surface.height, r.bottom)
     if x1 < x2 and y1 < y2:
-        surface._pixels[y1:y2, x1:x2] = [cr, cg, cb, ca]
+        _fill_pixels(surface._pixels[y1:y2, x1:x2], c)
 
 
 def circle(surface: Surface, x: int, y: int, r: int, color) -> None:
@@ -109,31 +149,63 @@ def aacircle(surface: Surface, x: int, y: int, r: int, color) -> None:
     """Draw an anti-aliased circle."""
     c = _clr(color)
     steps = max(36, int(2 * _math.pi * r))
-    for i in range(steps):
-        a1 = 2 * _math.pi * i / steps
-        a2 = 2 * _math.pi * (i + 1) / steps
-        x1f = x + r * _math.cos(a1)
-        y1f = y + r * _math.sin(a1)
-        x2f = x + r * _math.cos(a2)
-        y2f = y + r * _math.sin(a2)
-        _aa_line(surface, x1f, y1f, x2f, y2f, c)
+    _aa_outline(surface, x, y, r, r, steps, c)
+
+
+def _aa_outline(surface, x, y, rx, ry, steps, color) -> None:
+    """Anti-aliased closed curve through *steps* points of an ellipse."""
+    a = 2 * _math.pi * np.arange(steps + 1) / steps
+    xs = (x + rx * np.cos(a)).tolist()
+    ys = (y + ry * np.sin(a)).tolist()
+    for x1f, y1f, x2f, y2f in zip(xs, ys, xs[1:], ys[1:]):
+        _aa_line(surface, x1f, y1f, x2f, y2f, color)
 
 
 def filled_circle(surface: Surface, x: int, y: int, r: int, color) -> None:
     """Draw a filled circle."""
     c = _clr(color)
-    _midpoint_circle(surface, x, y, r, c, filled=True)
+    if r < 0:
+        return
+    px = surface._pixels
+    h, w = px.shape[:2]
+    half = _midpoint_half_widths(r)
+    dst, value = _pixel_target(px, c)
+    # One span store per row; the octant walk overwrote most rows 2-4 times.
+    for dy in range(max(-r, -y), min(r, h - 1 - y) + 1):
+        hw = half[abs(dy)]
+        x0 = max(0, x - hw)
+        x1 = min(w, x + hw + 1)
+        if x0 < x1:
+            dst[y + dy, x0:x1] = value
+
+
+def _midpoint_half_widths(radius: int) -> list[int]:
+    """Half-width of each row ``|dy| = 0..radius`` of a midpoint-filled circle."""
+    half = [0] * (radius + 1)
+    x, y = 0, radius
+    d = 1 - radius
+    while x <= y:
+        if x > half[y]:
+            half[y] = x
+        half[x] = y
+        x += 1
+        if d < 0:
+            d += 2 * x + 1
+        else:
+            y -= 1
+            d += 2 * (x - y) + 1
+    return half
 
 
 def _midpoint_circle(surface, cx, cy, radius, color, filled):
     """Midpoint circle rasterization."""
     px = surface._pixels
     h, w = px.shape[:2]
-    cr, cg, cb, ca = color
+    dst, value = _pixel_target(px, color)
 
     def _plot(x, y):
         if 0 <= x < w and 0 <= y < h:
-            px[y, x] = [cr, cg, cb, ca]
+            dst[y, x] = value
 
     def _hline(x1, x2, y):
         if y < 0 or y >= h:
@@ -141,7 +213,7 @@ def _midpoint_circle(surface, cx, cy, radius, color, filled):
         x1 = max(0, x1)
         x2 = min(w - 1, x2)
         if x1 <= x2:
-            px[y, x1:x2 + 1] = [cr, cg, cb, ca]
+            dst[y, x1:x2 + 1] = value
 
     x, y = 0, radius
     d = 1 - radius
@@ -173,14 +245,8 @@ def ellipse(surface: Surface, x: int, y: int,
     """Draw an unfilled ellipse."""
     c = _clr(color)
     steps = max(36, int(_math.pi * (rx + ry)))
-    px = surface._pixels
-    h, w = px.shape[:2]
-    for i in range(steps):
-        a = 2 * _math.pi * i / steps
-        ex = int(round(x + rx * _math.cos(a)))
-        ey = int(round(y + ry * _math.sin(a)))
-        if 0 <= ex < w and 0 <= ey < h:
-            px[ey, ex] = list(c)
+    a = 2 * _math.pi * np.arange(steps) / steps
+    _plot_points(surface, x + rx * np.cos(a), y + ry * np.sin(a), c)
 
 
 def aaellipse(surface: Surface, x: int, y: int,
@@ -188,35 +254,35 @@ def aaellipse(surface: Surface, x: int, y: int,
     """Draw an anti-aliased ellipse."""
     c = _clr(color)
     steps = max(36, int(_math.pi * (rx + ry)))
-    for i in range(steps):
-        a1 = 2 * _math.pi * i / steps
-        a2 = 2 * _math.pi * (i + 1) / steps
-        x1f = x + rx * _math.cos(a1)
-        y1f = y + ry * _math.sin(a1)
-        x2f = x + rx * _math.cos(a2)
-        y2f = y + ry * _math.sin(a2)
-        _aa_line(surface, x1f, y1f, x2f, y2f, c)
+    _aa_outline(surface, x, y, rx, ry, steps, c)
 
 
 def filled_ellipse(surface: Surface, x: int, y: int,
                    rx: int, ry: int, color) -> None:
     """Draw a filled ellipse."""
-    cr, cg, cb, ca = _clr(color)
+    c = _clr(color)
     px = surface._pixels
     h, w = px.shape[:2]
-    for row in range(max(0, y - ry), min(h, y + ry + 1)):
-        dy = row - y
-        if ry == 0:
-            half_w = rx
-        else:
-            val = 1 - (dy * dy) / (ry * ry)
-            if val < 0:
-                continue
-            half_w = int(rx * _math.sqrt(val))
+    top = max(0, y - ry)
+    bottom = min(h, y + ry + 1)
+    if top >= bottom:
+        return
+    if ry == 0:
+        halves = [rx] * (bottom - top)
+    elif bottom - top < _VECTOR_ELLIPSE_MIN:
+        rr = ry * ry
+        halves = [int(rx * _math.sqrt(1 - (dy * dy) / rr))
+                  for dy in range(top - y, bottom - y)]
+    else:
+        # Same float64 arithmetic as the per-row math.sqrt, all rows at once.
+        dy = np.arange(top - y, bottom - y)
+        halves = (rx * np.sqrt(1 - (dy * dy) / (ry * ry))).astype(np.int64).tolist()
+    dst, value = _pixel_target(px, c)
+    for row, half_w in zip(range(top, bottom), halves):
         x1 = max(0, x - half_w)
-        x2 = min(w - 1, x + half_w)
-        if x1 <= x2:
-            px[row, x1:x2 + 1] = [cr, cg, cb, ca]
+        x2 = min(w, x + half_w + 1)
+        if x1 < x2:
+            dst[row, x1:x2] = value
 
 
 def arc(surface: Surface, x: int, y: int, r: int,
@@ -228,14 +294,16 @@ def arc(surface: Surface, x: int, y: int, r: int,
     if ea < sa:
         ea += 2 * _math.pi
     steps = max(36, int(abs(ea - sa) * r))
+    a = sa + (ea - sa) * np.arange(steps + 1) / steps
+    _plot_points(surface, x + r * np.cos(a), y + r * np.sin(a), c)
+
+
+def _plot_points(surface, xs, ys, color) -> None:
+    """Round float coordinates to pixels and set the in-bounds ones."""
     px = surface._pixels
     h, w = px.shape[:2]
-    for i in range(steps + 1):
-        a = sa + (ea - sa) * i / steps
-        px_x = int(round(x + r * _math.cos(a)))
-        px_y = int(round(y + r * _math.sin(a)))
-        if 0 <= px_x < w and 0 <= px_y < h:
-            px[px_y, px_x] = list(c)
+    _set_pixels(px, np.rint(xs).astype(np.intp), np.rint(ys).astype(np.intp),
+                color, h, w)
 
 
 def pie(surface: Surface, x: int, y: int, r: int,
@@ -275,10 +343,16 @@ def polygon(surface: Surface, points, color) -> None:
     """Draw an unfilled polygon."""
     c = _clr(color)
     pts = [(int(p[0]), int(p[1])) for p in points]
-    for i in range(len(pts)):
-        x1, y1 = pts[i]
-        x2, y2 = pts[(i + 1) % len(pts)]
-        line(surface, x1, y1, x2, y2, c)
+    if not pts:
+        return
+    # Rasterise every edge in one pass and store all pixels with one scatter.
+    x0s, y0s = zip(*pts)
+    x1s = x0s[1:] + x0s[:1]
+    y1s = y0s[1:] + y0s[:1]
+    xs, ys = _bresenham_segments(x0s, y0s, x1s, y1s)
+    px = surface._pixels
+    h, w = px.shape[:2]
+    _set_pixels(px, xs, ys, c, h, w)
 
 
 def aapolygon(surface: Surface, points, color) -> None:
@@ -305,20 +379,24 @@ def bezier(surface: Surface, points, steps: int, color) -> None:
     if n < 2:
         return
 
-    prev = None
-    for s in range(steps + 1):
-        t = s / steps
-        tmp = list(pts)
-        for k in range(1, n):
-            tmp = [
-                (tmp[i][0] * (1 - t) + tmp[i + 1][0] * t,
-                 tmp[i][1] * (1 - t) + tmp[i + 1][1] * t)
-                for i in range(len(tmp) - 1)
-            ]
-        curr = (int(round(tmp[0][0])), int(round(tmp[0][1])))
-        if prev is not None:
-            line(surface, prev[0], prev[1], curr[0], curr[1], c)
-        prev = curr
+    if steps < 1:
+        return
+
+    # De Casteljau run for every step at once; the same arithmetic as a
+    # per-step reduction, so rounding ties land on the same pixels.
+    t = (np.arange(steps + 1) / steps)[:, None, None]
+    u = 1 - t
+    tmp = np.array(pts, dtype=np.float64)[None]
+    for _ in range(1, n):
+        tmp = tmp[:, :-1] * u + tmp[:, 1:] * t
+    curve = np.rint(tmp[:, 0]).astype(np.int64)
+    if len(curve) < 2:
+        return
+    xs, ys = _bresenham_segments(curve[:-1, 0], curve[:-1, 1],
+                                 curve[1:, 0], curve[1:, 1])
+    px = surface._pixels
+    h, w = px.shape[:2]
+    _set_pixels(px, xs, ys, c, h, w)
 
 
 def textured_polygon(surface: Surface, points, texture: Surface,
@@ -333,14 +411,7 @@ def _aa_line(surface: Surface, x0: float, y0: float,
     """Xiaolin Wu's anti-aliased line."""
     px = surface._pixels
     h, w = px.shape[:2]
-    r, g, b, a = color
-
-    def _plot_aa(x: int, y: int, brightness: float):
-        if 0 <= x < w and 0 <= y < h:
-            alpha_f = brightness * (a / 255.0)
-            existing = px[y, x].astype(np.float32)
-            new = np.array([r, g, b, a], dtype=np.float32)
-            px[y, x] = (existing * (1 - alpha_f) + new * alpha_f).astype(np.uint8)
+    opacity = color[3] / 255.0
 
     steep = abs(y1 - y0) > abs(x1 - x0)
     if steep:
@@ -350,6 +421,11 @@ def _aa_line(surface: Surface, x0: float, y0: float,
         x0, x1 = x1, x0
         y0, y1 = y1, y0
 
+    def _plot_aa(x: int, y: int, brightness: float):
+        if steep:
+            x, y = y, x
+        _blend_pixel(px, x, y, color, brightness * opacity, h, w)
+
     dx = x1 - x0
     dy = y1 - y0
     gradient = dy / dx if dx != 0 else 1.0
@@ -359,12 +435,8 @@ def _aa_line(surface: Surface, x0: float, y0: float,
     xgap = 1.0 - ((x0 + 0.5) % 1)
     xpxl1 = int(xend)
     ypxl1 = int(yend)
-    if steep:
-        _plot_aa(ypxl1, xpxl1, (1 - (yend % 1)) * xgap)
-        _plot_aa(ypxl1 + 1, xpxl1, (yend % 1) * xgap)
-    else:
-        _plot_aa(xpxl1, ypxl1, (1 - (yend % 1)) * xgap)
-        _plot_aa(xpxl1, ypxl1 + 1, (yend % 1) * xgap)
+    _plot_aa(xpxl1, ypxl1, (1 - (yend % 1)) * xgap)
+    _plot_aa(xpxl1, ypxl1 + 1, (yend % 1) * xgap)
     intery = yend + gradient
 
     xend = round(x1)
@@ -372,18 +444,25 @@ def _aa_line(surface: Surface, x0: float, y0: float,
     xgap = (x1 + 0.5) % 1
     xpxl2 = int(xend)
     ypxl2 = int(yend)
-    if steep:
-        _plot_aa(ypxl2, xpxl2, (1 - (yend % 1)) * xgap)
-        _plot_aa(ypxl2 + 1, xpxl2, (yend % 1) * xgap)
-    else:
-        _plot_aa(xpxl2, ypxl2, (1 - (yend % 1)) * xgap)
-        _plot_aa(xpxl2, ypxl2 + 1, (yend % 1) * xgap)
+    _plot_aa(xpxl2, ypxl2, (1 - (yend % 1)) * xgap)
+    _plot_aa(xpxl2, ypxl2 + 1, (yend % 1) * xgap)
 
-    for x in range(xpxl1 + 1, xpxl2):
-        if steep:
-            _plot_aa(int(intery), x, 1 - (intery % 1))
-            _plot_aa(int(intery) + 1, x, intery % 1)
-        else:
+    n = xpxl2 - xpxl1 - 1
+    if n < _VECTOR_AALINE_MIN:
+        for x in range(xpxl1 + 1, xpxl2):
             _plot_aa(x, int(intery), 1 - (intery % 1))
             _plot_aa(x, int(intery) + 1, intery % 1)
-        intery += gradient
+            intery += gradient
+        return
+
+    xs = np.arange(xpxl1 + 1, xpxl2)
+    # cumsum adds sequentially, matching an ``intery += gradient`` loop.
+    intery = np.cumsum(np.concatenate(([intery], np.full(n - 1, gradient))))
+    ipart = np.trunc(intery).astype(np.intp)
+    fpart = np.mod(intery, 1)
+    if steep:
+        _blend_pixels(px, ipart, xs, color, (1 - fpart) * opacity, h, w)
+        _blend_pixels(px, ipart + 1, xs, color, fpart * opacity, h, w)
+    else:
+        _blend_pixels(px, xs, ipart, color, (1 - fpart) * opacity, h, w)
+        _blend_pixels(px, xs, ipart + 1, color, fpart * opacity, h, w)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+import sys
 from pathlib import Path
 from typing import BinaryIO, Union
 
@@ -89,29 +90,36 @@ def load_sized_svg(file: FileLike, size: tuple[int, int]) -> Surface:
     return surf
 
 
+_FMT_MAP = {
+    ".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG",
+    ".bmp": "BMP", ".tga": "TGA", ".webp": "WEBP",
+}
+
+
 def save(surface: Surface, file: FileLike, namehint: str = "") -> None:
-    """Save a Surface to a file (PNG, JPEG, BMP, TGA)."""
+    """Save a Surface to a file (PNG, JPEG, BMP, TGA, WEBP)."""
     Image = _ensure_pil()
-    img = Image.fromarray(surface._pixels, "RGBA")
 
     fmt = None
     if isinstance(file, (str, Path)):
-        ext = Path(file).suffix.lower()
-        _FMT_MAP = {
-            ".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG",
-            ".bmp": "BMP", ".tga": "TGA",
-        }
-        fmt = _FMT_MAP.get(ext, "PNG")
+        fmt = _FMT_MAP.get(Path(file).suffix.lower(), "PNG")
     elif namehint:
-        ext = Path(namehint).suffix.lower()
-        _FMT_MAP = {
-            ".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG",
-            ".bmp": "BMP", ".tga": "TGA",
-        }
-        fmt = _FMT_MAP.get(ext, "PNG")
+        fmt = _FMT_MAP.get(Path(namehint).suffix.lower(), "PNG")
 
     if fmt == "JPEG":
-        img = img.convert("RGB")
+        # Wrap the RGBA buffer as RGBX so the JPEG encoder drops alpha while
+        # reading it, instead of converting to a separate RGB image first.
+        pixels = np.ascontiguousarray(surface._pixels)
+        h, w = pixels.shape[:2]
+        img = Image.frombuffer("RGBX", (w, h), pixels, "raw", "RGBX", 0, 1)
+    else:
+        img = Image.fromarray(surface._pixels, "RGBA")
+
+    if fmt == "WEBP":
+        # method=0 is libwebp's fastest encoder setting; exact keeps the RGB
+        # of fully transparent pixels, which lossless mode drops otherwise.
+        img.save(file, format=fmt, lossless=True, exact=True, method=0)
+        return
 
     img.save(file, format=fmt or "PNG")
 
@@ -135,6 +143,36 @@ def get_sdl_image_version(linked: bool = True):
     return None
 
 
+# Byte order of each format as indices into an RGBA pixel.
+_CHANNEL_ORDER = {
+    "ARGB": np.array([3, 0, 1, 2], dtype=np.intp),
+    "BGRA": np.array([2, 1, 0, 3], dtype=np.intp),
+    "ABGR": np.array([3, 2, 1, 0], dtype=np.intp),
+}
+
+# Where each RGBA channel sits in a pixel of the given format.
+_RGBA_SOURCE_ORDER = {
+    "RGB": (0, 1, 2),
+    "ARGB": (1, 2, 3, 0),
+    "BGRA": (2, 1, 0, 3),
+    "ABGR": (3, 2, 1, 0),
+}
+
+
+def _swizzle_words(v: np.ndarray, fmt: str) -> np.ndarray:
+    """Reorder the bytes of little-endian RGBA words into *fmt*."""
+    if fmt == "ARGB":
+        out = np.left_shift(v, 8)
+        out |= v >> 24
+    elif fmt == "BGRA":
+        out = v & 0xFF00FF00
+        out |= (v >> 16) & 0xFF
+        out |= (v & 0xFF) << 16
+    else:
+        out = v.byteswap()
+    return out
+
+
 def tobytes(surface: Surface, format: str = "RGBA",
             flipped: bool = False, pitch: int = -1) -> bytes:
     """Transfer Surface pixels to a byte string."""
@@ -143,22 +181,26 @@ def tobytes(surface: Surface, format: str = "RGBA",
         pixels = pixels[::-1]
 
     fmt = format.upper()
-    if fmt == "RGBA":
+    if fmt == "RGBA" or fmt == "RGBX":
         return pixels.tobytes()
-    elif fmt == "ARGB":
-        return pixels[:, :, [3, 0, 1, 2]].tobytes()
-    elif fmt == "BGRA":
-        return pixels[:, :, [2, 1, 0, 3]].tobytes()
-    elif fmt == "ABGR":
-        return pixels[:, :, [3, 2, 1, 0]].tobytes()
+    elif fmt in _CHANNEL_ORDER:
+        if sys.byteorder == "little":
+            try:
+                # Shifting whole uint32 words is several times faster than
+                # gathering channels with fancy indexing.
+                words = pixels.view(np.uint32)[..., 0]
+            except ValueError:
+                pass
+            else:
+                return _swizzle_words(words, fmt).tobytes()
+        return np.take(pixels, _CHANNEL_ORDER[fmt], axis=2).tobytes()
     elif fmt == "RGB":
         return pixels[:, :, :3].tobytes()
-    elif fmt == "RGBX":
-        return pixels.tobytes()
     elif fmt == "P":
-        gray = (pixels[:, :, 0].astype(np.uint16) * 299 +
-                pixels[:, :, 1].astype(np.uint16) * 587 +
-                pixels[:, :, 2].astype(np.uint16) * 114) // 1000
+        # uint32: 255 * 587 does not fit in uint16.
+        gray = (pixels[:, :, 0].astype(np.uint32) * 299 +
+                pixels[:, :, 1].astype(np.uint32) * 587 +
+                pixels[:, :, 2].astype(np.uint32) * 114) // 1000
         return gray.astype(np.uint8).tobytes()
     else:
         raise ValueError(f"Unsupported format: {format}")
@@ -177,33 +219,31 @@ def frombytes(data: bytes, size: tuple[int, int],
     w, h = size
     fmt = format.upper()
 
-    if fmt == "RGBA":
-        arr = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4)).copy()
-    elif fmt == "RGB":
+    if fmt == "RGB":
         raw = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 3))
-        arr = np.empty((h, w, 4), dtype=np.uint8)
-        arr[:, :, :3] = raw
-        arr[:, :, 3] = 255
-    elif fmt == "ARGB":
+    elif fmt in ("RGBA", "RGBX", "ARGB", "BGRA", "ABGR"):
         raw = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4))
-        arr = raw[:, :, [1, 2, 3, 0]].copy()
-    elif fmt == "BGRA":
-        raw = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4))
-        arr = raw[:, :, [2, 1, 0, 3]].copy()
-    elif fmt == "ABGR":
-        raw = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4))
-        arr = raw[:, :, [3, 2, 1, 0]].copy()
-    elif fmt == "RGBX":
-        arr = np.frombuffer(data, dtype=np.uint8).reshape((h, w, 4)).copy()
-        arr[:, :, 3] = 255
     else:
         raise ValueError(f"Unsupported format: {format}")
 
+    # Convert straight into the new surface so the image is copied once.
+    surf = Surface((w, h))
+    dst = surf._pixels
     if flipped:
-        arr = arr[::-1].copy()
+        dst = dst[::-1]
 
-    surf = Surface((w, h))
-    surf._pixels[:] = arr
+    if fmt == "RGBA":
+        dst[...] = raw
+    elif fmt == "RGBX":
+        dst[...] = raw
+        dst[..., 3] = 255
+    else:
+        # One strided copy per channel is several times faster than a
+        # multi-channel slice or fancy-index assignment.
+        for i, c in enumerate(_RGBA_SOURCE_ORDER[fmt]):
+            dst[..., i] = raw[..., c]
+        if fmt == "RGB":
+            dst[..., 3] = 255
     return surf
 
 
@@ -220,5 +260,9 @@ def frombuffer(data, size: tuple[int, int],
     if isinstance(data, (bytes, bytearray)):
         raw = data
     else:
-        raw = bytes(data)
+        try:
+            # Read contiguous buffers in place; frombytes copies them once.
+            raw = memoryview(data).cast("B")
+        except TypeError:
+            raw = bytes(data)
     return frombytes(raw, size, format)
@@ -58,26 +58,30 @@ for _k, _n in list(_KEY_TO_NAME.items()):
     _NAME_TO_KEY[_n] = _k
 
 
+_SCANCODE_SIZE = 512
+
+
 class ScancodeWrapper(tuple):
     """Tuple subclass returned by ``get_pressed()`` — indexed by key constant."""
 
-    def __new__(cls, mapping: dict[int, bool], size: int = 512):
+    def __new__(cls, mapping: dict[int, bool], size: int = _SCANCODE_SIZE):
         data = [False] * size
+        # Keys past the tuple (SDL-style 1 << 30 codes) go in a side dict.
+        extra = {}
         for k, v in mapping.items():
+            k = int(k)
             if 0 <= k < size:
                 data[k] = v
+            elif k >= size:
+                extra[k] = bool(v)
         obj = super().__new__(cls, data)
-        obj._mapping = {int(k): bool(v) for k, v in mapping.items() if int(k) >= 0}
+        obj._mapping = extra
         return obj
 
     def __getitem__(self, index):
-        if isinstance(index, slice):
-            return super().__getitem__(index)
-        if index < 0:
-            return super().__getitem__(index)
-        if index >= len(self):
+        if index.__class__ is not slice and index >= len(self):
             return self._mapping.get(int(index), False)
-        return super().__getitem__(index)
+        return tuple.__getitem__(self, index)
 
 
 def get_focused() -> bool:
@@ -86,8 +90,16 @@ def get_focused() -> bool:
     return get_backend().initialized
 
 
+_EMPTY_WRAPPER = ScancodeWrapper({})
+
+# get_pressed() result, reused until a key changes state.
+_cached_pressed: ScancodeWrapper | None = None
+_pressed_dirty: bool = True
+
+
 def get_pressed() -> ScancodeWrapper:
     """Get the state of all keyboard buttons."""
+    global _cached_pressed, _pressed_dirty
     if not _key_up_supported:
         now = _time.perf_counter()
         expired = [k for k, t in _down_times.items()
@@ -95,11 +107,19 @@ def get_pressed() -> ScancodeWrapper:
         for k in expired:
             _pressed[k] = False
             _down_times.pop(k, None)
-    return ScancodeWrapper(_pressed)
+        if expired:
+            _pressed_dirty = True
+    if _pressed_dirty or _cached_pressed is None:
+        # Clear the flag first so a key event during the rebuild re-dirties it.
+        _pressed_dirty = False
+        _cached_pressed = ScancodeWrapper(_pressed)
+    return _cached_pressed
 
 
 def get_just_pressed() -> ScancodeWrapper:
     """Get keys that were just pressed this frame."""
+    if not _just_pressed:
+        return _EMPTY_WRAPPER
     wrapper = ScancodeWrapper(_just_pressed)
     _just_pressed.clear()
     return wrapper
@@ -107,6 +127,8 @@ def get_just_pressed() -> ScancodeWrapper:
 
 def get_just_released() -> ScancodeWrapper:
     """Get keys that were just released this frame."""
+    if not _just_released:
+        return _EMPTY_WRAPPER
     wrapper = ScancodeWrapper(_just_released)
     _just_released.clear()
     return wrapper
@@ -142,10 +164,10 @@ def name(key: int, use_compat: bool = True) -> str:
 
 def key_code(name_str: str) -> int:
     """Get the key constant from a descriptive name."""
-    n = name_str.lower().strip()
-    if n in _NAME_TO_KEY:
-        return _NAME_TO_KEY[n]
-    raise ValueError(f"unknown key name: {name_str!r}")
+    key = _NAME_TO_KEY.get(name_str.lower().strip())
+    if key is None:
+        raise ValueError(f"unknown key name: {name_str!r}")
+    return key
 
 
 def start_text_input() -> None:
@@ -166,16 +188,18 @@ def set_text_input_rect(rect) -> None:
 
 
 def _key_down(key: int, mods: int) -> None:
-    global _mods
+    global _mods, _pressed_dirty
     _pressed[key] = True
+    _pressed_dirty = True
     _just_pressed[key] = True
     _mods = mods
     _down_times[key] = _time.perf_counter()
 
 
 def _key_up(key: int, mods: int) -> None:
-    global _mods
+    global _mods, _pressed_dirty
     _pressed[key] = False
+    _pressed_dirty = True
     _just_released[key] = True
     _mods = mods
     _down_times.pop(key, None)
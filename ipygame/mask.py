@@ -16,13 +16,13 @@ __all__ = [
     "from_threshold",
 ]
 
+# Number of mask bits ANDed per step in ``Mask.overlap``.
+_OVERLAP_BAND_SIZE = 1 << 14
+
 
 def from_surface(surface: Surface, threshold: int = 127) -> "Mask":
     """Create a Mask from a Surface's alpha channel."""
-    alpha = surface._pixels[:, :, 3]
-    m = Mask(surface.get_size())
-    m._bits[:] = alpha > threshold
-    return m
+    return _mask_from_bits(surface._pixels[:, :, 3] > threshold)
 
 
 def from_threshold(surface: Surface, color, threshold=(0, 0, 0, 255),
@@ -35,9 +35,14 @@ def from_threshold(surface: Surface, color, threshold=(0, 0, 0, 255),
     target = np.array([c.r, c.g, c.b, c.a], dtype=np.int16)
     thresh = np.array([t.r, t.g, t.b, t.a], dtype=np.int16)
     diff = np.abs(px - target)
-    within = np.all(diff <= thresh, axis=2)
-    m = Mask(surface.get_size())
-    m._bits[:] = within
+    return _mask_from_bits(np.all(diff <= thresh, axis=2))
+
+
+def _mask_from_bits(bits: np.ndarray) -> "Mask":
+    """Wrap an (H, W) bool array as a Mask without copying it."""
+    m = Mask.__new__(Mask)
+    m._h, m._w = bits.shape
+    m._bits = bits
     return m
 
 
@@ -82,10 +87,11 @@ class Mask:
         self._bits[:] = False
 
     def invert(self) -> None:
-        self._bits = ~self._bits
+        np.logical_not(self._bits, out=self._bits)
 
     def count(self) -> int:
-        return int(self._bits.sum())
+        # count_nonzero reads the bool bytes directly; sum() widens to int64.
+        return int(np.count_nonzero(self._bits))
 
     def overlap(self, other: "Mask", offset: tuple[int, int]) -> tuple[int, int] | None:
         """Return the first overlapping bit position, or None."""
@@ -96,14 +102,17 @@ class Mask:
         y2 = min(self._h, other._h + oy)
         if x1 >= x2 or y1 >= y2:
             return None
-        self_slice = self._bits[y1:y2, x1:x2]
-        other_slice = other._bits[y1 - oy:y2 - oy, x1 - ox:x2 - ox]
-        overlap = self_slice & other_slice
-        indices = np.argwhere(overlap)
-        if len(indices) == 0:
-            return None
-        ry, rx = indices[0]
-        return (int(rx + x1), int(ry + y1))
+        # AND the masks a band of rows at a time so a hit near the top returns
+        # without touching the rest; bands keep the row-major first hit.
+        step = max(1, _OVERLAP_BAND_SIZE // (x2 - x1))
+        for y in range(y1, y2, step):
+            y_end = min(y + step, y2)
+            hit = (self._bits[y:y_end, x1:x2] &
+                   other._bits[y - oy:y_end - oy, x1 - ox:x2 - ox])
+            if hit.any():
+                ry, rx = divmod(int(hit.argmax()), x2 - x1)
+                return (rx + x1, ry + y)
+        return None
 
     def overlap_area(self, other: "Mask", offset: tuple[int, int]) -> int:
         """Count overlapping set bits."""
@@ -115,7 +124,7 @@ class Mask:
             return 0
         s = self._bits[y1:y2, x1:x2]
         o = other._bits[y1 - oy:y2 - oy, x1 - ox:x2 - ox]
-        return int((s & o).sum())
+        return int(np.count_nonzero(s & o))
 
     def overlap_mask(self, other: "Mask", offset: tuple[int, int]) -> "Mask":
         """Return a Mask of overlapping bits."""
@@ -152,24 +161,34 @@ class Mask:
 
     def centroid(self) -> tuple[int, int]:
         """Return the centroid of set bits."""
-        indices = np.argwhere(self._bits)
-        if len(indices) == 0:
+        # Like angle(), average from per-row/column counts rather than
+        # listing every set bit.
+        cols = np.count_nonzero(self._bits, axis=0)
+        rows = np.count_nonzero(self._bits, axis=1)
+        n = int(rows.sum())
+        if n == 0:
             return (0, 0)
-        return (int(indices[:, 1].mean()), int(indices[:, 0].mean()))
+        return (int(cols @ np.arange(self._w)) // n,
+                int(rows @ np.arange(self._h)) // n)
 
     def angle(self) -> float:
         """Return the orientation angle of set bits in degrees."""
-        indices = np.argwhere(self._bits)
-        if len(indices) < 2:
-            return 0.0
-        ys, xs = indices[:, 0].astype(float), indices[:, 1].astype(float)
-        cx, cy = xs.mean(), ys.mean()
-        xs -= cx
-        ys -= cy
         import math
-        cov_xx = (xs * xs).sum()
-        cov_xy = (xs * ys).sum()
-        cov_yy = (ys * ys).sum()
+        bits = self._bits
+        cols = np.count_nonzero(bits, axis=0)
+        rows = np.count_nonzero(bits, axis=1)
+        n = int(rows.sum())
+        if n < 2:
+            return 0.0
+        # Raw moments from per-row/column counts instead of listing every set
+        # bit.  Scaled by n, the central moments stay exact integers.
+        xs = np.arange(self._w)
+        ys = np.arange(self._h)
+        sx = int(cols @ xs)
+        sy = int(rows @ ys)
+        cov_xx = n * int(cols @ (xs * xs)) - sx * sx
+        cov_xy = n * int(ys @ (bits @ xs)) - sx * sy
+        cov_yy = n * int(rows @ (ys * ys)) - sy * sy
         theta = 0.5 * math.atan2(2 * cov_xy, cov_xx - cov_yy)
         return math.degrees(theta)
 
@@ -181,8 +200,10 @@ class Mask:
             padded[:-2, 1:-1] & padded[2:, 1:-1] &
             padded[1:-1, :-2] & padded[1:-1, 2:]
         )
-        indices = np.argwhere(edge)
-        return [(int(x), int(y)) for y, x in indices[::every]]
+        ys, xs = np.nonzero(edge)
+        # tolist() yields Python ints in one pass; zip pairs them up without
+        # a per-point int() call.
+        return list(zip(xs[::every].tolist(), ys[::every].tolist()))
 
     def scale(self, size: tuple[int, int]) -> "Mask":
         """Return a scaled copy of the mask."""
@@ -190,9 +211,7 @@ class Mask:
         w, h = int(size[0]), int(size[1])
         img = Image.fromarray(self._bits.astype(np.uint8) * 255, "L")
         img = img.resize((w, h), Image.NEAREST)
-        m = Mask((w, h))
-        m._bits = np.array(img, dtype=np.uint8) > 127
-        return m
+        return _mask_from_bits(np.array(img, dtype=np.uint8) > 127)
 
     def connected_component(self, pos=None) -> "Mask":
         """Return the connected component containing *pos* (or the largest)."""
@@ -204,28 +223,28 @@ class Mask:
                 label = labels[y, x]
                 if label == 0:
                     return Mask(self.get_size())
-                m = Mask(self.get_size())
-                m._bits = labels == label
-                return m
+                return _mask_from_bits(labels == label)
         if n == 0:
             return Mask(self.get_size())
         counts = np.bincount(labels.ravel())
         counts[0] = 0
         largest = counts.argmax()
-        m = Mask(self.get_size())
-        m._bits = labels == largest
-        return m
+        return _mask_from_bits(labels == largest)
 
     def connected_components(self, minimum: int = 0) -> list["Mask"]:
         """Return all connected components."""
         from scipy import ndimage
         labels, n = ndimage.label(self._bits)
         result = []
-        for i in range(1, n + 1):
-            bits = labels == i
-            if bits.sum() >= minimum:
+        # find_objects gives every label's bounding box in one pass, so each
+        # component only compares labels inside its own box.
+        for i, box in enumerate(ndimage.find_objects(labels), 1):
+            if box is None:
+                continue
+            bits = labels[box] == i
+            if np.count_nonzero(bits) >= minimum:
                 m = Mask(self.get_size())
-                m._bits = bits
+                m._bits[box] = bits
                 result.append(m)
         return result
 
@@ -234,13 +253,12 @@ class Mask:
         from scipy import ndimage
         labels, n = ndimage.label(self._bits)
         rects = []
-        for i in range(1, n + 1):
-            ys, xs = np.where(labels == i)
-            if len(xs) == 0:
+        for box in ndimage.find_objects(labels):
+            if box is None:
                 continue
-            x1, x2 = int(xs.min()), int(xs.max()) + 1
-            y1, y2 = int(ys.min()), int(ys.max()) + 1
-            rects.append(Rect(x1, y1, x2 - x1, y2 - y1))
+            ys, xs = box
+            rects.append(Rect(xs.start, ys.start,
+                              xs.stop - xs.start, ys.stop - ys.start))
         return rects
 
     def convolve(self, other: "Mask", output: "Mask | None" = None,
@@ -255,12 +273,11 @@ class Mask:
             output = Mask((result_w, result_h))
         out_h, out_w = output._bits.shape
         ox, oy = int(offset[0]), int(offset[1])
-        # Copy the relevant portion
-        for y in range(out_h):
-            for x in range(out_w):
-                cy, cx = y - oy, x - ox
-                if 0 <= cy < result_h and 0 <= cx < result_w:
-                    output._bits[y, x] = conv[cy, cx] > 0.5
+        # Copy the part of the result that lands inside output, shifted by offset.
+        y1, y2 = max(0, oy), min(out_h, oy + result_h)
+        x1, x2 = max(0, ox), min(out_w, ox + result_w)
+        if y1 < y2 and x1 < x2:
+            output._bits[y1:y2, x1:x2] = conv[y1 - oy:y2 - oy, x1 - ox:x2 - ox] > 0.5
         return output
 
     def to_surface(self, surface: Surface | None = None,
@@ -276,20 +293,25 @@ class Mask:
         uc = Color(unsetcolor) if unsetcolor is not None else None
         dx, dy = int(dest[0]), int(dest[1])
 
-        for y in range(self._h):
-            for x in range(self._w):
-                tx, ty = x + dx, y + dy
-                if 0 <= tx < surface.width and 0 <= ty < surface.height:
-                    if self._bits[y, x]:
-                        if setsurface is not None and x < setsurface.width and y < setsurface.height:
-                            surface._pixels[ty, tx] = setsurface._pixels[y, x]
-                        elif sc is not None:
-                            surface._pixels[ty, tx] = [sc.r, sc.g, sc.b, sc.a]
-                    else:
-                        if unsetsurface is not None and x < unsetsurface.width and y < unsetsurface.height:
-                            surface._pixels[ty, tx] = unsetsurface._pixels[y, x]
-                        elif uc is not None:
-                            surface._pixels[ty, tx] = [uc.r, uc.g, uc.b, uc.a]
+        # Mask window that lands inside the target surface.
+        mx1, my1 = max(0, -dx), max(0, -dy)
+        mx2 = min(self._w, surface.width - dx)
+        my2 = min(self._h, surface.height - dy)
+        if mx1 >= mx2 or my1 >= my2:
+            return surface
+        region = surface._pixels[my1 + dy:my2 + dy, mx1 + dx:mx2 + dx]
+        bits = self._bits[my1:my2, mx1:mx2]
+        for selected, source, color in ((bits, setsurface, sc),
+                                        (~bits, unsetsurface, uc)):
+            if color is not None:
+                region[selected] = (color.r, color.g, color.b, color.a)
+            if source is not None:
+                # Pixels the source surface covers take precedence over color.
+                sw = min(mx2, source.width) - mx1
+                sh = min(my2, source.height) - my1
+                if sw > 0 and sh > 0:
+                    sub = selected[:sh, :sw]
+                    region[:sh, :sw][sub] = source._pixels[my1:my1 + sh, mx1:mx1 + sw][sub]
         return surface
 
     def copy(self) -> "Mask":
@@ -46,7 +46,7 @@ class Vector2:
 
     def __add__(self, other):
         ox, oy = _unpack2(other)
-        return Vector2(self.x + ox, self.y + oy)
+        return _vec2(self.x + ox, self.y + oy)
 
     __radd__ = __add__
 
@@ -58,11 +58,11 @@ class Vector2:
 
     def __sub__(self, other):
         ox, oy = _unpack2(other)
-        return Vector2(self.x - ox, self.y - oy)
+        return _vec2(self.x - ox, self.y - oy)
 
     def __rsub__(self, other):
         ox, oy = _unpack2(other)
-        return Vector2(ox - self.x, oy - self.y)
+        return _vec2(ox - self.x, oy - self.y)
 
     def __isub__(self, other):
         ox, oy = _unpack2(other)
@@ -72,9 +72,9 @@ class Vector2:
 
     def __mul__(self, scalar):
         if isinstance(scalar, (int, float)):
-            return Vector2(self.x * scalar, self.y * scalar)
+            return _vec2(self.x * scalar, self.y * scalar)
         ox, oy = _unpack2(scalar)
-        return Vector2(self.x * ox, self.y * oy)
+        return _vec2(self.x * ox, self.y * oy)
 
     __rmul__ = __mul__
 
@@ -90,9 +90,9 @@ class Vector2:
 
     def __truediv__(self, scalar):
         if isinstance(scalar, (int, float)):
-            return Vector2(self.x / scalar, self.y / scalar)
+            return _vec2(self.x / scalar, self.y / scalar)
         ox, oy = _unpack2(scalar)
-        return Vector2(self.x / ox, self.y / oy)
+        return _vec2(self.x / ox, self.y / oy)
 
     def __itruediv__(self, scalar):
         if isinstance(scalar, (int, float)):
@@ -106,15 +106,15 @@ class Vector2:
 
     def __floordiv__(self, scalar):
         if isinstance(scalar, (int, float)):
-            return Vector2(self.x // scalar, self.y // scalar)
+            return _vec2(self.x // scalar, self.y // scalar)
         ox, oy = _unpack2(scalar)
-        return Vector2(self.x // ox, self.y // oy)
+        return _vec2(self.x // ox, self.y // oy)
 
     def __neg__(self):
-        return Vector2(-self.x, -self.y)
+        return _vec2(-self.x, -self.y)
 
     def __pos__(self):
-        return Vector2(self.x, self.y)
+        return _vec2(self.x, self.y)
 
     def __eq__(self, other):
         try:
@@ -134,7 +134,7 @@ class Vector2:
         return f"<Vector2({self.x}, {self.y})>"
 
     def copy(self) -> "Vector2":
-        return Vector2(self.x, self.y)
+        return _vec2(self.x, self.y)
 
     def length(self) -> float:
         return _math.hypot(self.x, self.y)
@@ -149,7 +149,7 @@ class Vector2:
         m = self.length()
         if m == 0:
             raise ValueError("Cannot normalize a zero-length vector")
-        return Vector2(self.x / m, self.y / m)
+        return _vec2(self.x / m, self.y / m)
 
     def normalize_ip(self) -> None:
         m = self.length()
@@ -203,7 +203,7 @@ class Vector2:
         rad = _math.radians(angle)
         c = _math.cos(rad)
         s = _math.sin(rad)
-        return Vector2(self.x * c - self.y * s, self.x * s + self.y * c)
+        return _vec2(self.x * c - self.y * s, self.x * s + self.y * c)
 
     def rotate_ip(self, angle: float) -> None:
         rad = _math.radians(angle)
@@ -214,17 +214,33 @@ class Vector2:
     def rotate_rad(self, angle: float) -> "Vector2":
         c = _math.cos(angle)
         s = _math.sin(angle)
-        return Vector2(self.x * c - self.y * s, self.x * s + self.y * c)
+        return _vec2(self.x * c - self.y * s, self.x * s + self.y * c)
 
     def rotate_rad_ip(self, angle: float) -> None:
         c = _math.cos(angle)
         s = _math.sin(angle)
         self.x, self.y = self.x * c - self.y * s, self.x * s + self.y * c
 
+    @staticmethod
+    def rotate_array(arr, angle: float):
+        """Rotate an ``(..., 2)`` array of x, y rows by *angle* degrees.
+
+        Equivalent to calling ``rotate`` on every row, but done as a single
+        matrix product — use it for particles and other large batches.
+        """
+        import numpy as np
+
+        arr = np.asarray(arr)
+        dtype = arr.dtype if arr.dtype.kind == "f" else np.float64
+        rad = _math.radians(angle)
+        c = _math.cos(rad)
+        s = _math.sin(rad)
+        return arr @ np.array([[c, s], [-s, c]], dtype=dtype)
+
     def reflect(self, normal) -> "Vector2":
         nx, ny = _unpack2(normal)
         d = 2 * (self.x * nx + self.y * ny)
-        return Vector2(self.x - d * nx, self.y - d * ny)
+        return _vec2(self.x - d * nx, self.y - d * ny)
 
     def reflect_ip(self, normal) -> None:
         nx, ny = _unpack2(normal)
@@ -234,7 +250,7 @@ class Vector2:
 
     def lerp(self, other, t: float) -> "Vector2":
         ox, oy = _unpack2(other)
-        return Vector2(self.x + (ox - self.x) * t, self.y + (oy - self.y) * t)
+        return _vec2(self.x + (ox - self.x) * t, self.y + (oy - self.y) * t)
 
     def slerp(self, other, t: float) -> "Vector2":
         ox, oy = _unpack2(other)
@@ -250,7 +266,7 @@ class Vector2:
         sin_angle = _math.sin(angle)
         a = _math.sin((1 - t) * angle) / sin_angle
         b = _math.sin(t * angle) / sin_angle
-        return Vector2(a * self.x + b * ox, a * self.y + b * oy)
+        return _vec2(a * self.x + b * ox, a * self.y + b * oy)
 
     def move_towards(self, target, max_distance: float) -> "Vector2":
         ox, oy = _unpack2(target)
@@ -260,7 +276,7 @@ class Vector2:
         if dist <= max_distance or dist < 1e-6:
             return Vector2(ox, oy)
         ratio = max_distance / dist
-        return Vector2(self.x + dx * ratio, self.y + dy * ratio)
+        return _vec2(self.x + dx * ratio, self.y + dy * ratio)
 
     def move_towards_ip(self, target, max_distance: float) -> None:
         v = self.move_towards(target, max_distance)
@@ -295,7 +311,24 @@ class Vector2:
         return abs(self.x - ox) < epsilon and abs(self.y - oy) < epsilon
 
 
+_new_vector2 = object.__new__
+
+
+def _vec2(x: float, y: float) -> Vector2:
+    """Build a Vector2 from two floats without going through ``__init__``."""
+    v = _new_vector2(Vector2)
+    v.x = x
+    v.y = y
+    return v
+
+
 def _unpack2(obj):
+    # Exact type checks first: this runs on every binary operation.
+    t = type(obj)
+    if t is Vector2:
+        return obj.x, obj.y
+    if t is tuple or t is list:
+        return float(obj[0]), float(obj[1])
     if isinstance(obj, Vector2):
         return obj.x, obj.y
     if isinstance(obj, (tuple, list)):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from typing import Sequence
 
 import numpy as np
@@ -15,6 +17,16 @@ __all__ = ["Surface"]
 def _color_to_rgba(c) -> tuple[int, int, int, int]:
     if isinstance(c, Color):
         return c._as_rgba_tuple()
+    if isinstance(c, list):
+        c = tuple(c)
+    try:
+        return _cached_color_to_rgba(c)
+    except TypeError:
+        # Unhashable (or invalid, which raises again below).
+        return _parse_color(c)
+
+
+def _parse_color(c) -> tuple[int, int, int, int]:
     if isinstance(c, str):
         return Color(c)._as_rgba_tuple()
     if isinstance(c, int):
@@ -27,6 +39,23 @@ def _color_to_rgba(c) -> tuple[int, int, int, int]:
     raise TypeError(f"invalid color: {c!r}")
 
 
+_cached_color_to_rgba = lru_cache(maxsize=256)(_parse_color)
+
+
+def _native_pixel(r: int, g: int, b: int, a: int) -> int:
+    """Pack RGBA into the uint32 that reads back as these bytes in ``_pixels``."""
+    return int.from_bytes(bytes((r, g, b, a)), sys.byteorder)
+
+
+def _fill_pixels(region: np.ndarray, rgba: tuple[int, int, int, int]) -> None:
+    """Set every pixel of an (h, w, 4) uint8 view to *rgba*."""
+    try:
+        # One uint32 store per pixel instead of broadcasting a 4-tuple.
+        region.view(np.uint32)[..., 0] = _native_pixel(*rgba)
+    except ValueError:
+        region[...] = rgba
+
+
 class Surface:
     """A 2-D image stored as a NumPy RGBA pixel buffer.
 
@@ -167,7 +196,7 @@ class Surface:
             return area
 
         x, y, w, h = area
-        self._pixels[y:y + h, x:x + w] = (r, g, b, a)
+        _fill_pixels(self._pixels[y:y + h, x:x + w], (r, g, b, a))
         return area
 
     def blit(
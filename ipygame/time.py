@@ -27,7 +27,7 @@ def get_ticks() -> int:
     backend = get_backend()
     if backend.init_ticks is None:
         return 0
-    return int((_time.perf_counter() - backend.init_ticks) * 1000)
+    return (_time.perf_counter_ns() - backend.init_ticks) // 1_000_000
 
 
 def wait(milliseconds: int) -> int: